@@ -0,0 +1,103 @@
+"""Measure how dataclass construction with `dcv` fields scales across threads.
+
+Every thread builds the same number of instances and the total throughput
+is compared with a single thread. Scaling close to the number of threads
+is only possible on free-threaded builds.
+
+Usage:
+
+    python -m benchmarks.threads --threads 1 2 4 8 --objects 20000
+"""
+import argparse
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional
+from dcv.fields import (
+    TextField, IntField, DecimalField, BoolField, EnumField, DateTimeField
+)
+
+
+class Status(Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+@dataclass
+class Account:
+    name: str = TextField(min_length=1, max_length=50, trim=True)
+    code: str = TextField(regex="^[A-Z]{3}$")
+    balance: Decimal = DecimalField(ge=0)
+    age: int = IntField(ge=18, lt=150)
+    active: bool = BoolField()
+    status: Status = EnumField()
+    created: datetime = DateTimeField()
+    email: Optional[str] = TextField(optional=True)
+
+
+def build(count: int, thread_index: int) -> None:
+    created = datetime(2021, 1, 1)
+    for index in range(count):
+        account = Account(
+            name=f" account {thread_index}-{index} ",
+            code="ABC",
+            balance=Decimal(index),
+            age=18 + index % 100,
+            active=bool(index % 2),
+            status=Status.ACTIVE,
+            created=created,
+        )
+        assert account.age == 18 + index % 100
+
+
+def run(threads: int, objects: int) -> float:
+    """Build `objects` instances in each of `threads` threads, return elapsed seconds."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(thread_index: int) -> None:
+        barrier.wait()
+        build(objects, thread_index)
+
+    workers = [threading.Thread(target=worker, args=(index, )) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--objects", type=int, default=20000, help="Instances built per thread.")
+    args = parser.parse_args(argv)
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled else 'disabled'}")
+    print(f"{'threads':>8} {'objects':>10} {'seconds':>9} {'objects/s':>12} {'scaling':>8}")
+
+    # Warm up caches before measuring.
+    build(100, 0)
+
+    baseline = None
+    for threads in args.threads:
+        elapsed = run(threads, args.objects)
+        throughput = threads * args.objects / elapsed
+        if baseline is None:
+            baseline = throughput / threads
+        print(
+            f"{threads:>8} {threads * args.objects:>10} {elapsed:>9.3f} "
+            f"{throughput:>12.0f} {throughput / baseline:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
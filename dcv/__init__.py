@@ -1,3 +1,49 @@
 import logging
+from importlib import import_module
+from typing import Any
+from dcv.encoder import dump, dumps, iterencode
+from dcv.mapping import from_dict, validate_mapping
+from dcv.instance import fast_copy, replace, track_changes, changed_fields, changes, mark_clean
+from dcv.validators import cross_field
 
 logging.basicConfig(level=logging.DEBUG)
+
+# Optional subsystems, imported the first time one of their names is used,
+# e.g. `dcv.cache` imports `sqlite3`.
+_LAZY_ATTRS = {
+    "validate_records": "dcv.records",
+    "ValidationCache": "dcv.cache",
+    "validate_many": "dcv.cache",
+    "build_model": "dcv.model",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "dump",
+    "dumps",
+    "iterencode",
+    "from_dict",
+    "validate_mapping",
+    "fast_copy",
+    "replace",
+    "track_changes",
+    "changed_fields",
+    "changes",
+    "mark_clean",
+    "cross_field",
+    "validate_records",
+    "ValidationCache",
+    "validate_many",
+    "build_model"
+]
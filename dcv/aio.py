@@ -0,0 +1,111 @@
+"""Validate records coming from asynchronous sources."""
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, Deque, Iterable, List, Mapping,
+    Optional, Type, TypeVar, Union
+)
+from dcv.exceptions import RecordError
+from dcv.mapping import from_dict
+
+T = TypeVar("T")
+
+
+async def validate_stream(
+    cls: Type[T],
+    source: Union[AsyncIterable[Mapping[str, Any]], Iterable[Mapping[str, Any]]],
+    *,
+    batch_size: int=100,
+    concurrency: int=4,
+    executor: Optional[Executor]=None,
+    coerce: bool=False
+) -> AsyncIterator[Union[T, RecordError]]:
+    """Build instances of `cls` from the mappings in `source`.
+
+    Records are grouped in batches of `batch_size` and built with `dcv.from_dict`.
+    If `executor` is given, batches are built in it, e.g. a thread or process pool,
+    otherwise batches are built in the event loop which is released between batches.
+    A process pool requires `cls` and the records to be picklable.
+
+    At most `concurrency` batches are in flight, `source` is not read
+    until the oldest batch finishes.
+
+    Results are yielded in the same order as `source`, invalid records
+    are yielded as a `RecordError` instead of an instance.
+    """
+    if batch_size < 1 or concurrency < 1:
+        raise ValueError("'batch_size' and 'concurrency' must be greater than 0.")
+
+    loop = asyncio.get_running_loop()
+    pending: Deque[Awaitable[List[Union[T, RecordError]]]] = deque()
+    batch: List[Mapping[str, Any]] = []
+    index = 0
+
+    async def submit() -> None:
+        nonlocal batch, index
+        if executor is not None:
+            pending.append(
+                loop.run_in_executor(executor, build_batch, cls, batch, index, coerce)
+            )
+        else:
+            future = loop.create_future()
+            future.set_result(build_batch(cls, batch, index, coerce))
+            pending.append(future)
+            await asyncio.sleep(0)
+
+        index += len(batch)
+        batch = []
+
+    try:
+        async for record in _aiter(source):
+            batch.append(record)
+            if len(batch) < batch_size:
+                continue
+
+            await submit()
+            while len(pending) >= concurrency:
+                for result in await pending.popleft():
+                    yield result
+
+        if batch:
+            await submit()
+
+        while pending:
+            for result in await pending.popleft():
+                yield result
+    finally:
+        for future in pending:
+            if isinstance(future, asyncio.Future):
+                future.cancel()
+
+
+def build_batch(
+    cls: Type[T],
+    records: List[Mapping[str, Any]],
+    start: int=0,
+    coerce: bool=False
+) -> List[Union[T, RecordError]]:
+    """Build an instance of `cls` for every record, `start` is the index of the first record.
+
+    Invalid records are returned as a `RecordError`.
+    """
+    results: List[Union[T, RecordError]] = []
+    for index, record in enumerate(records, start):
+        try:
+            results.append(from_dict(cls, record, coerce=coerce))
+        except Exception as error:
+            results.append(RecordError(index, record, error))
+
+    return results
+
+
+async def _aiter(
+    source: Union[AsyncIterable[Mapping[str, Any]], Iterable[Mapping[str, Any]]]
+) -> AsyncIterator[Mapping[str, Any]]:
+    if hasattr(source, "__aiter__"):
+        async for record in source:  # type: ignore[union-attr]
+            yield record
+    else:
+        for record in source:  # type: ignore[union-attr]
+            yield record
@@ -0,0 +1,283 @@
+"""Remember records known to be valid across runs."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import fields
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from types import CodeType, FunctionType, GetSetDescriptorType, MemberDescriptorType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Union
+from uuid import UUID
+from weakref import WeakKeyDictionary
+from dcv.exceptions import RecordError
+from dcv.fields import Field, MISSING
+from dcv.fields.abstract import VALIDATORS_ATTR_NAME, get_dependents
+from dcv.mapping import validate_mapping
+from dcv.utils import get_fields
+
+# Maximum number of keys looked up in a single query.
+LOOKUP_BATCH_SIZE = 500
+
+# Part of every schema fingerprint, increase it when a change in `dcv`
+# can make valid records invalid, e.g. in `validate_mapping`.
+FINGERPRINT_VERSION = 2
+
+# Types whose `repr` describes their values exactly, used by `record_key`.
+ENCODED_BY_REPR = (float, complex, bytes, Decimal, datetime, date, time, timedelta, UUID)
+
+_FINGERPRINTS: "WeakKeyDictionary[type, bytes]" = WeakKeyDictionary()
+
+
+class ValidationCache:
+    """Keys of records known to be valid, stored in a SQLite database at `path`.
+
+    Keys are computed with `record_key`, they include the schema fingerprint
+    of the class so changing any field constraint invalidates them.
+    The default `path` keeps the cache in memory.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]=":memory:") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS valid_records (key BLOB PRIMARY KEY) WITHOUT ROWID"
+            )
+
+    def __contains__(self, key: bytes) -> bool:
+        return bool(self.find([key]))
+
+    def find(self, keys: Iterable[bytes]) -> Set[bytes]:
+        """Return the keys in `keys` which are known to be valid."""
+        keys = list(keys)
+        found: Set[bytes] = set()
+        with self._lock:
+            for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+                batch = keys[start:start + LOOKUP_BATCH_SIZE]
+                rows = self._connection.execute(
+                    "SELECT key FROM valid_records WHERE key IN "
+                    f"({', '.join('?' * len(batch))})",
+                    batch
+                )
+                found.update(key for key, in rows)
+
+        return found
+
+    def add(self, keys: Iterable[bytes]) -> None:
+        """Record `keys` as valid."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO valid_records (key) VALUES (?)",
+                ((key,) for key in keys)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM valid_records")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "ValidationCache":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def schema_fingerprint(cls: type) -> bytes:
+    """Hash of everything in `cls` that decides if a record is valid.
+
+    It includes `FINGERPRINT_VERSION`, every dataclass field, the class and
+    public attributes of `dcv` fields, the code of every method and the constants
+    defined by the classes of `dcv` fields and the code of cross-field validators.
+    It is computed once per class.
+    """
+    try:
+        return _FINGERPRINTS[cls]
+    except KeyError:
+        pass
+
+    dcv_fields = get_fields(cls)
+    schema: List[Any] = [FINGERPRINT_VERSION, f"{cls.__module__}.{cls.__qualname__}"]
+    validators: Dict[Any, None] = {}
+    for dc_field in fields(cls):
+        schema.append((dc_field.name, dc_field.init, repr(dc_field.type)))
+        field = dcv_fields.get(dc_field.name)
+        if field is not None:
+            schema.append(_describe_field(field))
+            validators.update(
+                dict.fromkeys(get_dependents(cls, VALIDATORS_ATTR_NAME, dc_field.name))
+            )
+
+    for validator in validators:
+        schema.append((validator.public_attr_name, validator.names, _describe(validator.func)))
+
+    fingerprint = hashlib.sha256(repr(schema).encode()).digest()
+    _FINGERPRINTS[cls] = fingerprint
+    return fingerprint
+
+
+def _describe_field(field: Field) -> List[Any]:
+    field_type = type(field)
+    description: List[Any] = [f"{field_type.__module__}.{field_type.__qualname__}"]
+    for klass in field_type.__mro__:
+        if klass is object:
+            continue
+
+        for name, value in sorted(vars(klass).items()):
+            if isinstance(value, (staticmethod, classmethod)):
+                functions = [value.__func__]
+            elif isinstance(value, property):
+                functions = [value.fget, value.fset, value.fdel]
+            elif not callable(value) and not _is_class_internal(name, value):
+                # Class constants such as `TYPES` and `ERROR_MSGS`.
+                description.append((name, _describe(value)))
+                continue
+            else:
+                functions = [value]
+
+            description.extend(
+                (name, _describe(function))
+                for function in functions if isinstance(function, FunctionType)
+            )
+
+        for slot in getattr(klass, "__slots__", ()):
+            if not slot.startswith("_") and slot not in ("public_attr_name", "private_attr_name"):
+                description.append((slot, _describe(getattr(field, slot, None))))
+
+    return description
+
+
+def _is_class_internal(name: str, value: Any) -> bool:
+    """Check if a class attribute is set by Python, e.g. `__doc__` or the descriptors of slots."""
+    return (
+        (name.startswith("__") and name.endswith("__")) or
+        name == "_abc_impl" or
+        isinstance(value, (MemberDescriptorType, GetSetDescriptorType))
+    )
+
+
+def _describe(value: Any) -> str:
+    """Stable description of a value, functions are described by their code."""
+    if value is MISSING:
+        return "MISSING"
+    if isinstance(value, FunctionType):
+        return f"{value.__module__}.{value.__qualname__}:{_describe_code(value.__code__)}"
+
+    return repr(value)
+
+
+def _describe_code(code: CodeType) -> str:
+    # Names are not part of `co_code`, e.g. `self.a > self.b` and `self.b > self.a`
+    # only differ in `co_names`.
+    # Nested code objects are described recursively, their `repr` includes their address.
+    consts = [
+        _describe_code(const) if isinstance(const, CodeType) else repr(const)
+        for const in code.co_consts
+    ]
+    names = (code.co_names, code.co_varnames, code.co_freevars, code.co_cellvars)
+    return f"{hashlib.sha256(code.co_code).hexdigest()}:{names}:{consts}"
+
+
+def record_key(cls: type, record: Mapping[str, Any], coerce: bool=False) -> Optional[bytes]:
+    """Key of `record` validated as `cls`, `None` if it contains values which cannot be encoded.
+
+    Every value is encoded with its type, see `_encode`,
+    so records are only equal if their values are equal and have the same types.
+    """
+    try:
+        data = json.dumps(_encode(record), separators=(",", ":"))
+    except (TypeError, ValueError, RecursionError):
+        return None
+
+    digest = hashlib.sha256(schema_fingerprint(cls))
+    digest.update(b"\x01" if coerce else b"\x00")
+    digest.update(data.encode())
+    return digest.digest()
+
+
+def _encode(value: Any) -> Any:
+    """JSON `[type, payload]` pair describing `value` exactly.
+
+    Only builtin scalars, enums, `ENCODED_BY_REPR` types and containers of them are encoded,
+    a `TypeError` is raised for other values.
+    Mappings and sets are sorted, so their order does not change the result.
+    """
+    value_type = type(value)
+    tag = f"{value_type.__module__}.{value_type.__qualname__}"
+    if value is None or value_type in (bool, int, str):
+        return [tag, value]
+    if value_type in ENCODED_BY_REPR:
+        return [tag, repr(value)]
+    if isinstance(value, Enum):
+        return [tag, value.name]
+    if isinstance(value, (list, tuple)):
+        return [tag, [_encode(item) for item in value]]
+    if isinstance(value, (set, frozenset)):
+        return [tag, sorted((_encode(item) for item in value), key=_sort_key)]
+    if isinstance(value, Mapping):
+        return [tag, sorted(
+            ([_encode(key), _encode(item)] for key, item in value.items()), key=_sort_key
+        )]
+
+    raise TypeError(f"Values of type {tag} cannot be encoded.")
+
+
+def _sort_key(encoded: Any) -> str:
+    return json.dumps(encoded, separators=(",", ":"))
+
+
+def validate_many(
+    cls: type,
+    records: Iterable[Mapping[str, Any]],
+    coerce: bool=False,
+    cache: Optional[ValidationCache]=None
+) -> List[RecordError]:
+    """Validate `records` as `cls` with `dcv.validate_mapping`.
+
+    Records equal to a previous record are validated once.
+    If `cache` is given, records known to be valid are not validated again
+    and valid records are added to it.
+
+    Returns a `RecordError` for every invalid record, empty if every record is valid.
+    """
+    records = list(records)
+    keys = [record_key(cls, record, coerce) for record in records]
+    known: Set[bytes] = set()
+    if cache is not None:
+        known = cache.find({key for key in keys if key is not None})
+
+    errors: List[RecordError] = []
+    results: Dict[bytes, Optional[Exception]] = {}
+    valid: List[bytes] = []
+    for index, (record, key) in enumerate(zip(records, keys)):
+        if key is not None and key in known:
+            continue
+
+        if key is not None and key in results:
+            error = results[key]
+        else:
+            error = None
+            try:
+                validate_mapping(cls, record, coerce=coerce)
+            except Exception as exception:
+                error = exception
+
+            if key is not None:
+                results[key] = error
+                if error is None:
+                    valid.append(key)
+
+        if error is not None:
+            errors.append(RecordError(index, record, error))
+
+    if cache is not None and valid:
+        cache.add(valid)
+
+    return errors
@@ -0,0 +1,223 @@
+"""Serialize dataclasses using `dcv` fields straight to JSON text.
+
+No intermediate `dict` is built: every dataclass gets an encoding plan the
+first time it is serialized, one pre-selected encoder per field based on
+the `dcv` field managing it, and the plan is reused for every instance.
+"""
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, IO, Iterable, Iterator, List, Tuple
+from weakref import WeakKeyDictionary
+from dcv.fields import (
+    Field,
+    TextField,
+    IntField,
+    FloatField,
+    DecimalField,
+    BoolField,
+    EnumField,
+    DateTimeBaseField,
+    TimeDeltaField,
+)
+from dcv.utils import get_fields
+
+ITEM_SEPARATOR = ", "
+KEY_SEPARATOR = ": "
+
+# Number of chunks buffered by `dump` before writing to the stream.
+WRITE_BUFFER_SIZE = 512
+
+Encoder = Callable[[Any], str]
+Plan = List[Tuple[str, str, Encoder]]
+
+_PLANS: "WeakKeyDictionary[type, Plan]" = WeakKeyDictionary()
+
+
+def dumps(obj: Any) -> str:
+    """Serialize `obj` to a JSON formatted `str`."""
+    return "".join(iterencode(obj))
+
+
+def dump(obj: Any, fp: IO[str]) -> None:
+    """Serialize `obj` as a JSON formatted stream to `fp`.
+
+    `obj` can be an iterator, e.g. a generator of dataclass instances.
+    Chunks are buffered and written in batches of `WRITE_BUFFER_SIZE`.
+    """
+    buffer: List[str] = []
+    for chunk in iterencode(obj):
+        buffer.append(chunk)
+        if len(buffer) >= WRITE_BUFFER_SIZE:
+            fp.write("".join(buffer))
+            buffer.clear()
+
+    if buffer:
+        fp.write("".join(buffer))
+
+
+def iterencode(obj: Any) -> Iterator[str]:
+    """Encode `obj` and yield its JSON representation chunk by chunk."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        yield from _iterencode_dataclass(obj)
+    elif isinstance(obj, (list, tuple, Iterator)):
+        yield from _iterencode_list(obj)
+    else:
+        yield encode_value(obj)
+
+
+def encode_value(value: Any) -> str:
+    """Encode any supported value to JSON text.
+
+    Used for values which are not managed by a `dcv` field.
+    """
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return _encode_float(value)
+    if isinstance(value, Decimal):
+        return _encode_decimal(value)
+    if isinstance(value, Enum):
+        return encode_value(value.value)
+    if isinstance(value, (datetime, date, time)):
+        return _encode_isoformat(value)
+    if isinstance(value, timedelta):
+        return _encode_timedelta(value)
+    if isinstance(value, (list, tuple, Iterator)) or (
+        is_dataclass(value) and not isinstance(value, type)
+    ):
+        return "".join(iterencode(value))
+    if isinstance(value, dict):
+        return _encode_dict(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable.")
+
+
+def _iterencode_dataclass(obj: Any) -> Iterator[str]:
+    plan = _get_plan(type(obj))
+    separator = "{"
+    for prefix, name, encoder in plan:
+        yield separator
+        yield prefix
+        yield encoder(getattr(obj, name))
+        separator = ITEM_SEPARATOR
+
+    yield "}" if plan else "{}"
+
+
+def _iterencode_list(values: Iterable[Any]) -> Iterator[str]:
+    separator = "["
+    for value in values:
+        yield separator
+        yield from iterencode(value)
+        separator = ITEM_SEPARATOR
+
+    yield "]" if separator == ITEM_SEPARATOR else "[]"
+
+
+def _encode_dict(value: dict) -> str:
+    items = []
+    for key, item in value.items():
+        if not isinstance(key, str):
+            raise TypeError(f"Keys must be str, not {type(key).__name__}.")
+        items.append(f"{encode_basestring_ascii(key)}{KEY_SEPARATOR}{encode_value(item)}")
+
+    return "{" + ITEM_SEPARATOR.join(items) + "}"
+
+
+def _encode_int(value: int) -> str:
+    if value is True or value is False:
+        return encode_value(value)
+    return int.__repr__(value)
+
+
+def _encode_text(value: Any) -> str:
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+    return encode_value(value)
+
+
+def _encode_float(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _encode_decimal(value: Decimal) -> str:
+    return f'"{value}"'
+
+
+def _encode_isoformat(value: Any) -> str:
+    return f'"{value.isoformat()}"'
+
+
+def _encode_timedelta(value: timedelta) -> str:
+    return float.__repr__(value.total_seconds())
+
+
+def _nullable(encoder: Encoder) -> Encoder:
+    def encode(value: Any) -> str:
+        if value is None:
+            return "null"
+        return encoder(value)
+    return encode
+
+
+def _get_field_encoder(field: Field) -> Encoder:
+    """Choose the encoder for the values of `field`.
+
+    Specialized encoders are used only for fields which guarantee
+    the type of their values. Everything else uses `encode_value`.
+    """
+    if isinstance(field, BoolField):
+        return encode_value
+    if isinstance(field, IntField):
+        encoder: Encoder = _encode_int
+    elif isinstance(field, FloatField):
+        encoder = _encode_float
+    elif isinstance(field, DecimalField):
+        encoder = _encode_decimal
+    elif isinstance(field, TimeDeltaField):
+        encoder = _encode_timedelta
+    elif isinstance(field, DateTimeBaseField) and field.TYPES != DateTimeBaseField.TYPES:
+        encoder = _encode_isoformat
+    elif isinstance(field, EnumField):
+        encoder = lambda value: encode_value(value.value)
+    elif isinstance(field, TextField):
+        encoder = _encode_text
+    else:
+        return encode_value
+
+    return _nullable(encoder)
+
+
+def _get_plan(cls: type) -> Plan:
+    try:
+        return _PLANS[cls]
+    except KeyError:
+        pass
+
+    dcv_fields = get_fields(cls)
+    plan: Plan = []
+    for dc_field in fields(cls):
+        field = dcv_fields.get(dc_field.name)
+        encoder = encode_value if field is None else _get_field_encoder(field)
+        prefix = f"{encode_basestring_ascii(dc_field.name)}{KEY_SEPARATOR}"
+        plan.append((prefix, dc_field.name, encoder))
+
+    _PLANS[cls] = plan
+    return plan
@@ -0,0 +1,33 @@
+from typing import Any, Dict
+
+
+class RecordError(Exception):
+    """Error validating a single record of a batch or a stream.
+
+    `index` is the position of the record in the batch or stream,
+    `record` is the invalid record and `error` the exception raised while validating it.
+    """
+
+    def __init__(self, index: int, record: Any, error: Exception) -> None:
+        super().__init__(index, record, error)
+        self.index = index
+        self.record = record
+        self.error = error
+
+    def __str__(self) -> str:
+        return f"Record {self.index} is not valid: {self.error}"
+
+
+class ValidationError(ValueError):
+    """Errors found validating a mapping.
+
+    `errors` maps the name of each invalid field, or cross-field validator,
+    to the exception raised while validating it.
+    """
+
+    def __init__(self, errors: Dict[str, Exception]) -> None:
+        super().__init__(errors)
+        self.errors = errors
+
+    def __str__(self) -> str:
+        return "; ".join(f"{name}: {error}" for name, error in self.errors.items())
@@ -9,6 +9,7 @@ from dcv.fields.number import (
 )
 from dcv.fields.enum import EnumField
 from dcv.fields.bool import BoolField
+from dcv.fields.computed import ComputedField
 from dcv.fields.datetime import (
     DateTimeBaseField,
     DateTimeField,
@@ -29,6 +30,7 @@ __all__ = [
     "ComplexField",
     "EnumField",
     "BoolField",
+    "ComputedField",
     "DateTimeBaseField",
     "DateTimeField",
     "TimeDeltaField",
@@ -1,6 +1,9 @@
+import dataclasses
 import logging
+import operator
 from abc import ABC, abstractmethod, ABCMeta
-from typing import Any, get_origin, get_args, get_type_hints
+from typing import Any, Callable, Dict, Optional, Tuple, cast, get_origin, get_args, get_type_hints
+from weakref import WeakKeyDictionary
 
 LOG = logging.getLogger(__name__)
 
@@ -9,6 +12,43 @@ class _MISSING_TYPE:
 
 MISSING = _MISSING_TYPE()
 
+# Resolved type hints of classes using fields, shared by all their fields.
+_TYPE_HINTS: "WeakKeyDictionary[type, Dict[str, Any]]" = WeakKeyDictionary()
+
+
+def _get_type_hints(owner: Any) -> Dict[str, Any]:
+    """Resolve the type hints of `owner` once instead of once per field."""
+    try:
+        return _TYPE_HINTS[owner]
+    except KeyError:
+        pass
+
+    hints = get_type_hints(owner)
+    _TYPE_HINTS[owner] = hints
+    return hints
+
+
+# Limits supported by fields and how values are compared with them.
+LIMIT_OPERATORS = (
+    ("gt", operator.gt),
+    ("lt", operator.lt),
+    ("ge", operator.ge),
+    ("le", operator.le),
+)
+
+# Instance attribute holding the names of fields set since the instance was clean.
+CHANGES_ATTR_NAME = "_dcv_changes"
+
+# Class attribute mapping field names to the names of computed values depending on them.
+DEPENDENTS_ATTR_NAME = "_dcv_dependents"
+# Class attribute mapping field names to the cross-field validators using them.
+VALIDATORS_ATTR_NAME = "_dcv_validators"
+# Instance attribute set once the cross-field validators have run after `__init__`.
+VALIDATED_ATTR_NAME = "_dcv_validated"
+# Class attribute holding the class and a mapping of the names of its fields
+# with `fast_read` to their `FastReadField`, see `_fast_read_setattr`.
+FAST_READ_ATTR_NAME = "_dcv_fast_read"
+
 class Field(ABC):
     """Abstract Field class.
 
@@ -21,12 +61,33 @@ class Field(ABC):
 
     If `default` is set, `optional` is automatically set to `True`.
 
+    If `default_factory` is set, it is called the first time the value is read
+    without having been set. The result is validated and stored in the instance.
+    With `fast_read` it is called when the instance is created instead.
+
     `TYPES` should always be a tuple of valid object types and not generics.
+
+    A field is shared by every instance of the class it is assigned to.
+    Its attributes are only written when the field is created and assigned to a class,
+    getting and setting values only reads them and writes to the instance.
+    This keeps fields safe to use from multiple threads, including free-threaded builds.
+    Custom fields should not store per-value state in the field.
+
+    If `fast_read` is set, the field is replaced in the class by a `FastReadField`
+    and writes are intercepted by a `__setattr__` added to the class,
+    which every attribute write of the class goes through.
+    Values are read directly from the instance `__dict__` without calling `__get__`,
+    defaults are stored in the instance when it is created.
+    Reading a value that has not been set works like `Field.__get__`.
+    It can only be used by fields set in `__init__` which store values unchanged
+    under the attribute name, in classes which are not frozen.
+    Subclasses defining `__setattr__` must call `super().__setattr__`.
     """
     __slots__ = (
         'optional', 'use_private_attr', 'default',
-        'public_attr_name', 'private_attr_name', '_stored_value',
-        '_annotation'
+        'public_attr_name', 'private_attr_name',
+        '_annotation', 'fast_read', 'default_factory', '_has_dependents',
+        '_track_changes', '_valid_classes'
     )
 
     # Type to verify value set.
@@ -36,10 +97,17 @@ class Field(ABC):
         self,
         default: Any=MISSING,
         optional: bool=False,
-        use_private_attr: bool=False
+        use_private_attr: bool=False,
+        fast_read: bool=False,
+        default_factory: Optional[Callable[[], Any]]=None
     ) -> None:
+        if default is not MISSING and default_factory is not None:
+            raise ValueError("Cannot specify both 'default' and 'default_factory'.")
+
         self.optional = optional
         self.use_private_attr = use_private_attr
+        self.fast_read = fast_read
+        self.default_factory = default_factory
         if optional and default is MISSING:
            default = None
 
@@ -47,15 +115,23 @@ class Field(ABC):
             self.optional = True
 
         self.default = default
-        self._stored_value = None
         self._annotation = None
+        # Classes allowed by the type hint, resolved when the field is assigned to a class.
+        self._valid_classes: Any = None
+        # Set if a class using the field registers values depending on it,
+        # the registries of the instance class decide which ones are used.
+        self._has_dependents = False
+        # Set by `dcv.track_changes`.
+        self._track_changes = False
 
     def __set_name__(self, owner: Any, name: str) -> None:
         """Store necessary values."""
         self.public_attr_name = name
         self.private_attr_name = f"_{name}"
-        self._annotation = get_type_hints(owner).get(name, None)
-        self._get_annotation_valid_classes()
+        self._annotation = _get_type_hints(owner).get(name, None)
+        self._valid_classes = self._get_annotation_valid_classes()
+        if self.fast_read:
+            self._install_fast_read_field(owner, name)
 
     def __get__(self, obj: Any, objtype: Any=None) -> Any:
         """Get value.
@@ -64,6 +140,12 @@ class Field(ABC):
         """
         value: Any = self._get_value(obj)
 
+        if value is MISSING and self.default_factory is not None:
+            if obj is None:
+                # Dataclasses use it as the default value of `__init__`.
+                return MISSING
+            return self._set_default_from_factory(obj)
+
         self._check_value_has_been_set_or_optional(value)
 
         value = self._compute_default_value(value)
@@ -81,13 +163,115 @@ class Field(ABC):
 
         If a field is marked as optional and it has a value of None, no validation is run.
         """
+        if value is MISSING and self.default_factory is not None:
+            if not self.fast_read:
+                # The default is computed on first read.
+                return
+            value = self.default_factory()
+
+        value = self._clean_for_storage(value)
+
+        if self._has_dependents:
+            self._set_value_and_run_validators(obj, value)
+        else:
+            self._set_value(obj, value)
+
+        if self._track_changes:
+            self._record_change(obj)
+
+    def _record_change(self, obj: Any) -> None:
+        """Record the field has been set if the instance tracks its changes."""
+        changes = obj.__dict__.get(CHANGES_ATTR_NAME)
+        if changes is not None:
+            changes[self.public_attr_name] = None
+
+    def _clean(self, value: Any) -> Any:
+        """Return the value to store, transformed and validated."""
         value = self._compute_default_value(value)
 
+        if not self._check_value_is_optional_none(value):
+            value = self.transform(value)
+            self.validate(value)
+
+        return value
+
+    def _clean_for_storage(self, value: Any) -> Any:
+        """Return the cleaned value to pass to `_set_value`, see `_clean`.
+
+        Fields converting values for storage can override it
+        to reuse the conversion done while validating.
+        """
+        return self._clean(value)
+
+    def _set_value_and_run_validators(self, obj: Any, value: Any) -> None:
+        """Set value, remove computed values and run the cross-field validators using it.
+
+        Computed values and validators are the ones registered in the class of `obj`,
+        see `register_dependent`.
+        Validators only run once the instance has been created, see `dcv.cross_field`,
+        and all the fields they use have been set.
+        If a validator fails the previous value is restored, or removed if there was none.
+        """
+        validators = get_dependents(type(obj), VALIDATORS_ATTR_NAME, self.public_attr_name)
+        if validators and VALIDATED_ATTR_NAME not in obj.__dict__:
+            validators = ()
+        previous = self._get_value(obj) if validators else MISSING
+        self._set_value(obj, value)
+        self._invalidate_dependents(obj)
+
+        try:
+            for validator in validators:
+                if validator.is_ready(obj):
+                    validator(obj)
+        except Exception:
+            if previous is MISSING:
+                self._delete_value(obj)
+            else:
+                self._set_value(obj, previous)
+            self._invalidate_dependents(obj)
+            raise
+
+    def _invalidate_dependents(self, obj: Any) -> None:
+        """Remove stored computed values depending on this field."""
+        values = obj.__dict__
+        for name in get_dependents(type(obj), DEPENDENTS_ATTR_NAME, self.public_attr_name):
+            values.pop(name, None)
+
+    def _set_default_from_factory(self, obj: Any) -> Any:
+        """Compute, validate and store the value from `default_factory`."""
+        value = cast(Callable[[], Any], self.default_factory)()
         if not self._check_value_is_optional_none(value):
             value = self.transform(value)
             self.validate(value)
 
         self._set_value(obj, value)
+        return self._get_value(obj)
+
+    def _install_fast_read_field(self, owner: Any, name: str) -> None:
+        """Replace the field in `owner` with a `FastReadField` and intercept writes."""
+        if not self._has_plain_storage():
+            raise TypeError(
+                f"Attribute '{name}' cannot use 'fast_read', "
+                "values are not stored unchanged under the attribute name."
+            )
+
+        reader = FastReadField(self)
+        attribute = owner.__dict__.get(name)
+        if attribute is self:
+            setattr(owner, name, reader)
+        elif isinstance(attribute, dataclasses.Field) and attribute.default is self:
+            if not attribute.init:
+                raise TypeError(
+                    f"Attribute '{name}' cannot use 'fast_read', "
+                    "it must be set in '__init__'."
+                )
+            attribute.default = reader
+
+        _install_fast_read_setattr(owner)
+
+    def _has_plain_storage(self) -> bool:
+        """Check if values are stored unchanged in the instance `__dict__` under the attribute name."""
+        return not self.use_private_attr
 
     @abstractmethod
     def validate(self, value: Any) -> None:
@@ -98,6 +282,15 @@ class Field(ABC):
         """Implement if you want to transform value after validation."""
         return value
 
+    def coerce(self, value: Any) -> Any:
+        """Implement to convert values from their string representation.
+
+        Coercion is opt-in and runs before `transform`, e.g. `dcv.from_dict(..., coerce=True)`.
+        Values which cannot be converted must be returned unchanged
+        so `validate` reports the error.
+        """
+        return value
+
     def _get_value(self, obj: Any) -> Any:
         """Retrieve value from object.
 
@@ -123,8 +316,34 @@ class Field(ABC):
         else:
             obj.__dict__[self.public_attr_name] = value
 
+    def _delete_value(self, obj: Any) -> None:
+        """Remove value from object, `_get_value` returns `MISSING` afterwards."""
+        if self.use_private_attr:
+            if hasattr(obj, self.private_attr_name):
+                delattr(obj, self.private_attr_name)
+        else:
+            obj.__dict__.pop(self.public_attr_name, None)
+
+    def _validate_converted_limits(self, value: Any, converted_value: Any, limits: tuple) -> None:
+        """Check a value converted for storage against limits converted the same way.
+
+        `limits` holds `(limit_name, compare, limit, converted_limit)` tuples,
+        built from `LIMIT_OPERATORS`. Errors show the original value and limit.
+        """
+        for limit_name, compare, limit, converted_limit in limits:
+            if not compare(converted_value, converted_limit):
+                raise ValueError(
+                    self.ERROR_MSGS[limit_name].format(
+                        attr_name=self.public_attr_name,
+                        value=value,
+                        limit=limit
+                    )
+                )
+
     def _check_type(self, value: Any) -> None:
-        types = self._get_annotation_valid_classes()
+        types = self._valid_classes
+        if types is None:
+            types = self._get_annotation_valid_classes()
         if not isinstance(value, types):
             raise TypeError(
                 f"Value ({value}) set to field {self.public_attr_name} "
@@ -238,3 +457,133 @@ class Field(ABC):
 
     def __repr__(self):
         return self.__str__()
+
+
+def get_class_attribute(owner: Any, name: str) -> Any:
+    """Get the attribute `name` of `owner` without calling descriptors.
+
+    Fields wrapped by dataclasses or replaced by a `FastReadField` are unwrapped.
+    Returns `None` if the attribute does not exist.
+    """
+    for klass in owner.__mro__:
+        if name in vars(klass):
+            attribute = vars(klass)[name]
+            break
+    else:
+        return None
+
+    if isinstance(attribute, dataclasses.Field):
+        attribute = attribute.default
+    if isinstance(attribute, FastReadField):
+        attribute = attribute.field
+
+    return attribute
+
+
+def register_dependent(owner: Any, attr_name: str, field_name: str, dependent: Any) -> None:
+    """Register `dependent` for the field `field_name` in the registry `attr_name` of `owner`.
+
+    Every class registering dependents has its own registry, started from the
+    registries of its bases, so dependents of a subclass do not affect its bases
+    or sibling classes sharing the same fields.
+    """
+    registry = vars(owner).get(attr_name)
+    if registry is None:
+        registry = {}
+        for klass in reversed(owner.__mro__[1:]):
+            for name, dependents in vars(klass).get(attr_name, {}).items():
+                registry[name] = tuple(dict.fromkeys(registry.get(name, ()) + dependents))
+        setattr(owner, attr_name, registry)
+
+    dependents = registry.get(field_name, ())
+    if dependent not in dependents:
+        registry[field_name] = dependents + (dependent, )
+
+
+def get_dependents(cls: Any, attr_name: str, field_name: str) -> Tuple[Any, ...]:
+    """Get the dependents of the field `field_name` registered in `cls` or its bases."""
+    return getattr(cls, attr_name, {}).get(field_name, ())
+
+
+class FastReadField:
+    """Class attribute of fields with `fast_read` set.
+
+    It only implements `__get__`, so Python reads values set in the instance `__dict__`
+    without calling it, `__get__` is only called for values which have not been set.
+    Writes are passed to `write` by the `__setattr__` added to the class.
+    It is also the default value seen by dataclasses, setting it means the value was not given.
+    """
+    __slots__ = ('field', )
+
+    def __init__(self, field: Field) -> None:
+        self.field = field
+
+    def __get__(self, obj: Any, objtype: Any=None) -> Any:
+        if obj is None:
+            return self
+
+        return self.field.__get__(obj, objtype)
+
+    def write(self, obj: Any, value: Any) -> None:
+        field = self.field
+        if value is self:
+            if not field.optional and field.default_factory is None:
+                raise TypeError(
+                    f"{type(obj).__name__}.__init__() missing required argument: "
+                    f"'{field.public_attr_name}'"
+                )
+            value = MISSING
+
+        field.__set__(obj, value)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.field!r})"
+
+
+def _install_fast_read_setattr(owner: Any) -> None:
+    """Add a `__setattr__` to `owner` passing writes of fields with `fast_read` to them.
+
+    Other attributes are set with the `__setattr__` `owner` had.
+    The fields of a class are found the first time one of its instances is written.
+    """
+    setattr_ = owner.__setattr__
+    if getattr(setattr_, "_dcv_fast_read", False):
+        return
+
+    owner_readers: Dict[str, FastReadField] = {}
+
+    def __setattr__(self: Any, name: str, value: Any) -> None:
+        cls = type(self)
+        if cls is owner and owner_readers:
+            readers = owner_readers
+        else:
+            fast_read = getattr(cls, FAST_READ_ATTR_NAME, None)
+            if fast_read is None or fast_read[0] is not cls:
+                fast_read = _get_fast_read_fields(cls)
+            readers = fast_read[1]
+            if cls is owner:
+                owner_readers.update(readers)
+
+        reader = readers.get(name)
+        if reader is None:
+            setattr_(self, name, value)
+        else:
+            reader.write(self, value)
+
+    setattr(__setattr__, "_dcv_fast_read", True)
+    setattr(owner, "__setattr__", __setattr__)
+
+
+def _get_fast_read_fields(cls: Any) -> Tuple[Any, Dict[str, FastReadField]]:
+    """Find the `FastReadField` of every attribute of `cls`, stored in the class."""
+    readers: Dict[str, FastReadField] = {}
+    for klass in reversed(cls.__mro__):
+        for name, attribute in vars(klass).items():
+            if isinstance(attribute, FastReadField):
+                readers[name] = attribute
+            else:
+                readers.pop(name, None)
+
+    fast_read = (cls, readers)
+    setattr(cls, FAST_READ_ATTR_NAME, fast_read)
+    return fast_read
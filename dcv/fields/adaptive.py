@@ -0,0 +1,66 @@
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+# Number of runs between reorders.
+ADAPT_INTERVAL = 1024
+
+# (name, relative cost, check)
+Check = Tuple[str, float, Callable[[Any], None]]
+
+
+class AdaptiveChecks:
+    """Run constraint checks ordered by their observed failure rate.
+
+    Every `ADAPT_INTERVAL` runs checks are sorted so cheap and frequently failing
+    checks run first, which makes rejecting invalid values cheaper.
+    Failure counts are halved after each reorder so the order follows recent values.
+
+    Counters are updated without locks, concurrent runs might lose some counts,
+    which only affects the order in which checks run.
+    """
+    __slots__ = ('_initial_checks', '_checks', '_failures', '_runs')
+
+    def __init__(self, checks: Sequence[Check]) -> None:
+        self._initial_checks = tuple(checks)
+        self.reset()
+
+    def run(self, value: Any) -> None:
+        """Run every check, the first failing check raises."""
+        self._runs += 1
+        if self._runs >= ADAPT_INTERVAL:
+            self._reorder()
+
+        for name, _, check in self._checks:
+            try:
+                check(value)
+            except Exception:
+                self._failures[name] += 1
+                raise
+
+    def reset(self) -> None:
+        """Restore the initial order and discard observed failures."""
+        self._checks = self._initial_checks
+        self._failures: Dict[str, int] = {name: 0 for name, _, _ in self._initial_checks}
+        self._runs = 0
+
+    @property
+    def order(self) -> Tuple[str, ...]:
+        """Names of the checks in the order they run."""
+        return tuple(name for name, _, _ in self._checks)
+
+    def _reorder(self) -> None:
+        # Concurrent runs might reorder at the same time, the order only depends on
+        # failure counts and costs so it does not read the number of runs.
+        self._runs = 0
+        failures = self._failures
+        self._checks = tuple(
+            sorted(self._checks, key=lambda check: -failures[check[0]] / check[1])
+        )
+        self._failures = {name: count // 2 for name, count in failures.items()}
+
+
+def check(name: str, cost: float, method: Callable[..., None], *args: Any) -> Check:
+    """Build a check calling `method(value, *args)`."""
+    if args:
+        return (name, cost, lambda value: method(value, *args))
+
+    return (name, cost, method)
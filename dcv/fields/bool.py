@@ -1,26 +1,63 @@
 from dcv.fields import Field, MISSING
-from typing import Optional, Union, cast
+from dcv.fields.packed import PackedMixin
+from typing import Any, Callable, Optional, Union, cast
 
 
-class BoolField(Field):
-    """Field validation for bool values."""
+class BoolField(PackedMixin, Field):
+    """Field validation for bool values.
+
+    If `packed` is set, the value is stored in a few bits of an `int`
+    shared with every other packed field of the instance.
+    """
+    __slots__ = ('packed', '_offset', '_mask')
 
     ERROR_MSGS = {}
     TYPES = (bool, )
 
+    # Accepted string representations when coercing values.
+    STRINGS = {
+        "true": True, "false": False,
+        "1": True, "0": False,
+        "yes": True, "no": False,
+        "on": True, "off": False,
+    }
+
     def __init__(
         self,
         default: Optional[bool] = cast(bool, MISSING),
         optional: bool=False,
-        use_private_attr: bool=False
+        use_private_attr: bool=False, *,
+        fast_read: bool=False,
+        default_factory: Optional[Callable[[], Any]]=None,
+        packed: bool=False
     ):
         super().__init__(
             default=default,
             optional=optional,
-            use_private_attr=use_private_attr
+            use_private_attr=use_private_attr,
+            fast_read=fast_read,
+            default_factory=default_factory
         )
+        self.packed = packed
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        super().__set_name__(owner, name)
+        if self.packed:
+            self._allocate_bits(owner, 2)
+
+    def coerce(self, value: Union[str, bool]) -> Union[bool, str]:
+        if isinstance(value, str):
+            return self.STRINGS.get(value.strip().lower(), value)
+
+        return value
 
     def validate(self, value: bool) -> None:
         self._validate_optional(value)
 
         self._check_type(value)
+
+    def _encode(self, value: bool) -> int:
+        return 1 if value else 0
+
+    def _decode(self, code: int) -> bool:
+        return code == 1
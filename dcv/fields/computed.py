@@ -0,0 +1,64 @@
+from dcv.fields.abstract import (
+    DEPENDENTS_ATTR_NAME, Field, get_class_attribute, register_dependent
+)
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+
+class ComputedField:
+    """Value derived from other fields, computed once per instance.
+
+    `func` is called with the instance the first time the value is read
+    and the result is stored in the instance `__dict__`, following reads
+    do not call `ComputedField`.
+    Setting any field in `depends_on` removes the stored result so it is computed again.
+    `depends_on` can name `dcv` fields or other computed fields.
+
+    It should not have a type hint, otherwise dataclasses handle it as a field.
+    """
+    __slots__ = ('func', 'depends_on', 'public_attr_name')
+
+    def __init__(self, func: Callable[[Any], Any], depends_on: Iterable[str]) -> None:
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.public_attr_name: Optional[str] = None
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.public_attr_name = name
+        for field_name, field in self._get_dependencies(owner, set()).items():
+            register_dependent(owner, DEPENDENTS_ATTR_NAME, field_name, name)
+            field._has_dependents = True
+
+    def __get__(self, obj: Any, objtype: Any=None) -> Any:
+        if obj is None:
+            return self
+
+        value = self.func(obj)
+        obj.__dict__[self.public_attr_name] = value
+        return value
+
+    def _get_dependencies(self, owner: Any, seen: Set[int]) -> Dict[str, Field]:
+        """Find the fields this value depends on by name, through other computed fields."""
+        if id(self) in seen:
+            raise TypeError(
+                f"Attribute '{self.public_attr_name}' has a circular dependency."
+            )
+        seen.add(id(self))
+
+        fields: Dict[str, Field] = {}
+        for name in self.depends_on:
+            attribute = get_class_attribute(owner, name)
+            if isinstance(attribute, Field):
+                fields[name] = attribute
+            elif isinstance(attribute, ComputedField):
+                fields.update(attribute._get_dependencies(owner, seen))
+            else:
+                raise TypeError(
+                    f"Attribute '{self.public_attr_name}' depends on '{name}' "
+                    "which is not a field."
+                )
+
+        seen.discard(id(self))
+        return fields
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(func={self.func!r}, depends_on={self.depends_on!r})"
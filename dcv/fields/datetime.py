@@ -1,18 +1,70 @@
 from dcv.fields import Field, MISSING
-from typing import Optional, Union, cast
-from datetime import datetime, timedelta, date, time
+from dcv.fields.abstract import LIMIT_OPERATORS
+from typing import Any, Callable, Optional, Union, cast
+from datetime import datetime, timedelta, date, time, timezone, tzinfo
+from functools import lru_cache
+
+# Maximum number of distinct strings kept by each ISO 8601 parse cache.
+PARSE_CACHE_SIZE = 4096
+
+# Maximum number of `datetime` objects kept when materializing int storage.
+INT_STORAGE_CACHE_SIZE = 256
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_datetime(value: str) -> datetime:
+    if value[-1:] in ("Z", "z"):
+        value = f"{value[:-1]}+00:00"
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_time(value: str) -> time:
+    if value[-1:] in ("Z", "z"):
+        value = f"{value[:-1]}+00:00"
+    return time.fromisoformat(value)
+
+
+@lru_cache(maxsize=INT_STORAGE_CACHE_SIZE)
+def _datetime_from_micros(micros: int, tz: Optional[tzinfo]) -> datetime:
+    if tz is None:
+        return _EPOCH + timedelta(microseconds=micros)
+    return (_EPOCH_UTC + timedelta(microseconds=micros)).astimezone(tz)
+
 
 class DateTimeBaseField(Field):
-    """Datetime field validation."""
-    __slots__ = ('gt', 'lt', 'ge', 'le')
+    """Datetime field validation.
+
+    If `parse` is set, ISO 8601 strings and epoch numbers are converted
+    using `coerce` before validation. Parsed strings are cached.
+
+    If `tz` is set, `datetime` values are normalized to that timezone.
+    Naive values are assumed to already be in `tz`.
+
+    If `store_as_int` is set, values are stored as an `int` number of microseconds
+    and limits are checked against `int` values. Values are materialized on read.
+    Only fields with `INT_STORAGE` support it, they implement `_to_int` and `_from_int`.
+    """
+    __slots__ = ('gt', 'lt', 'ge', 'le', 'parse', 'tz', 'store_as_int', '_int_limits')
 
     ERROR_MSGS = {
         "gt": "'{attr_name}' value '{value}' must be greater than {limit}.",
         "lt": "'{attr_name}' value '{value}' must be less than {limit}.",
         "ge": "'{attr_name}' value '{value}' must be greater than or equals to {limit}.",
         "le": "'{attr_name}' value '{value}' must be less than or equals to {limit}.",
+        "naive": "'{attr_name}' value '{value}' must be naive when stored as int and no timezone is set.",
     }
     TYPES = (datetime, timedelta, date, time)
+    INT_STORAGE = False
 
     def __init__(
         self,
@@ -22,23 +74,50 @@ class DateTimeBaseField(Field):
         gt: Union[datetime, timedelta, date, time, None]=None,
         lt: Union[datetime, timedelta, date, time, None]=None,
         ge: Union[datetime, timedelta, date, time, None]=None,
-        le: Union[datetime, timedelta, date, time, None]=None
+        le: Union[datetime, timedelta, date, time, None]=None, *,
+        fast_read: bool=False,
+        default_factory: Optional[Callable[[], Any]]=None,
+        parse: bool=False,
+        tz: Optional[tzinfo]=None,
+        store_as_int: bool=False
     ):
         super().__init__(
             default=default,
             optional=optional,
-            use_private_attr=use_private_attr
+            use_private_attr=use_private_attr,
+            fast_read=fast_read,
+            default_factory=default_factory
         )
         self.gt = gt
         self.lt = lt
         self.ge = ge
         self.le = le
+        self.parse = parse
+        self.tz = tz
+        if store_as_int and not self.INT_STORAGE:
+            raise TypeError(f"{type(self).__name__} values cannot be stored as int.")
+        self.store_as_int = store_as_int
+        self._int_limits: tuple = ()
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        super().__set_name__(owner, name)
+        if self.store_as_int:
+            self._int_limits = tuple(
+                (limit_name, compare, limit, self._to_int(self._normalize_tz(limit)))
+                for limit_name, compare in LIMIT_OPERATORS
+                for limit in (getattr(self, limit_name),)
+                if limit is not None
+            )
 
     def validate(self, value: Union[datetime, timedelta, date, time, None]) -> None:
         self._validate_optional(value)
 
         self._check_type(value)
 
+        if self.store_as_int:
+            self._validate_converted_limits(value, self._to_int(value), self._int_limits)
+            return
+
         if self.gt is not None:
             self._validate_gt(value, self.gt)
 
@@ -51,6 +130,58 @@ class DateTimeBaseField(Field):
         if self.le is not None:
             self._validate_le(value, self.le)
 
+    def transform(self, value: Union[datetime, timedelta, date, time, str, int, float]) -> Union[datetime, timedelta, date, time, str, int, float]:
+        if self.parse:
+            value = self.coerce(value)
+
+        return self._normalize_tz(value)
+
+    def coerce(self, value: Union[datetime, timedelta, date, time, str, int, float]) -> Union[datetime, timedelta, date, time, str, int, float]:
+        """Convert ISO 8601 strings and epoch seconds.
+
+        Values that cannot be converted are returned unchanged.
+        """
+        try:
+            if isinstance(value, str):
+                return self._parse_str(value)
+
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return self._parse_number(value)
+        except (ValueError, OverflowError, OSError):
+            pass
+
+        return value
+
+    def _normalize_tz(self, value: Any) -> Any:
+        if self.tz is not None and isinstance(value, datetime):
+            if value.tzinfo is None:
+                return value.replace(tzinfo=self.tz)
+            return value.astimezone(self.tz)
+
+        return value
+
+    def _has_plain_storage(self) -> bool:
+        return not self.store_as_int and super()._has_plain_storage()
+
+    def _get_value(self, obj: Any) -> Any:
+        value = super()._get_value(obj)
+        if self.store_as_int and type(value) is int:
+            return self._from_int(value)
+
+        return value
+
+    def _set_value(self, obj: Any, value: Any) -> None:
+        if self.store_as_int and value is not None:
+            value = self._to_int(value)
+
+        super()._set_value(obj, value)
+
+    def _parse_str(self, value: str) -> Union[datetime, timedelta, date, time]:
+        return _parse_datetime(value)
+
+    def _parse_number(self, value: Union[int, float]) -> Union[datetime, timedelta, date, time]:
+        return datetime.fromtimestamp(value, timezone.utc)
+
     def _validate_gt(
         self,
         value: Union[datetime, timedelta, date, time],
@@ -114,16 +245,79 @@ class DateTimeBaseField(Field):
 
 
 class DateTimeField(DateTimeBaseField):
+    """Aware values stored as int require `tz` and are materialized in `tz`.
+
+    Without `tz`, aware values parsed from strings and epoch numbers
+    are converted to naive UTC values when stored as int.
+    """
+
     TYPES = (datetime,)
+    INT_STORAGE = True
+
+    def _to_int(self, value: datetime) -> int:
+        if value.tzinfo is None:
+            return (value - _EPOCH) // _MICROSECOND
+
+        if self.tz is None:
+            raise ValueError(
+                self.ERROR_MSGS["naive"].format(
+                    attr_name=self.public_attr_name,
+                    value=value
+                )
+            )
+
+        return (value - _EPOCH_UTC) // _MICROSECOND
+
+    def _from_int(self, value: int) -> datetime:
+        return _datetime_from_micros(value, self.tz)
+
+    def _parse_str(self, value: str) -> datetime:
+        return self._to_naive_utc(_parse_datetime(value))
+
+    def _parse_number(self, value: Union[int, float]) -> datetime:
+        return self._to_naive_utc(datetime.fromtimestamp(value, timezone.utc))
+
+    def _to_naive_utc(self, value: datetime) -> datetime:
+        if self.store_as_int and self.tz is None and value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return value
 
 
 class TimeDeltaField(DateTimeBaseField):
+    """Strings and numbers are parsed as a number of seconds."""
+
     TYPES = (timedelta,)
+    INT_STORAGE = True
+
+    def _to_int(self, value: timedelta) -> int:
+        return value // _MICROSECOND
+
+    def _from_int(self, value: int) -> timedelta:
+        return timedelta(microseconds=value)
+
+    def _parse_str(self, value: str) -> timedelta:
+        return timedelta(seconds=float(value))
+
+    def _parse_number(self, value: Union[int, float]) -> timedelta:
+        return timedelta(seconds=value)
 
 
 class DateField(DateTimeBaseField):
     TYPES = (date,)
 
+    def _parse_str(self, value: str) -> date:
+        return _parse_date(value)
+
+    def _parse_number(self, value: Union[int, float]) -> date:
+        return datetime.fromtimestamp(value, timezone.utc).date()
+
 
 class TimeField(DateTimeBaseField):
     TYPES = (time,)
+
+    def _parse_str(self, value: str) -> time:
+        return _parse_time(value)
+
+    def _parse_number(self, value: Union[int, float]) -> time:
+        raise ValueError("Numbers cannot be converted to time.")
@@ -1,27 +1,180 @@
 from dcv.fields import Field, MISSING
-from typing import Optional, Union, cast
+from dcv.fields.packed import PackedMixin
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple, Union, cast
 from enum import Enum
 
 
-class EnumField(Field):
-    """Field validation for enum values."""
+class EnumField(PackedMixin, Field):
+    """Field validation for enum values.
 
-    ERROR_MSGS = {}
+    If `packed` is set, the member ordinal is stored in a few bits of an `int`
+    shared with every other packed field of the instance.
+    Packed fields need a type hint with concrete `Enum` classes, e.g. a `Union` of them,
+    with at most `MAX_PACKED_MEMBERS` members in total.
+
+    If `choices` is set, values must be one of `choices`. Choices can be members
+    or raw values of the `Enum` used in the type hint.
+
+    Raw values are mapped to members with a `dict` built once. It is used by `coerce`
+    and it is case-insensitive for `str` values if `case_sensitive` is `False`.
+    """
+    __slots__ = (
+        'packed', '_offset', '_mask', '_members', '_ordinals',
+        'choices', 'case_sensitive', '_choices', '_by_value'
+    )
+
+    ERROR_MSGS = {
+        "choices": "'{attr_name}' value '{value}' is not a valid choice.",
+    }
     TYPES = (Enum, )
+    MAX_PACKED_MEMBERS = 256
 
     def __init__(
         self,
         default: Optional[Enum] = cast(Enum, MISSING),
         optional: bool=False,
-        use_private_attr: bool=False
+        use_private_attr: bool=False, *,
+        fast_read: bool=False,
+        default_factory: Optional[Callable[[], Any]]=None,
+        packed: bool=False,
+        choices: Optional[Iterable[Any]]=None,
+        case_sensitive: bool=True
     ):
         super().__init__(
             default=default,
             optional=optional,
-            use_private_attr=use_private_attr
+            use_private_attr=use_private_attr,
+            fast_read=fast_read,
+            default_factory=default_factory
         )
+        self.packed = packed
+        self._members: Tuple[Enum, ...] = ()
+        self._ordinals: Dict[Tuple[type, Enum], int] = {}
+        self.choices = None if choices is None else tuple(choices)
+        self.case_sensitive = case_sensitive
+        self._choices: Optional[FrozenSet[Enum]] = None
+        self._by_value: Dict[Any, Enum] = {}
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        super().__set_name__(owner, name)
+        enum_class = self._get_enum_class()
+
+        if self.choices is not None:
+            self._choices = frozenset(
+                self._get_member(enum_class, choice) for choice in self.choices
+            )
+
+        members: Iterable[Enum] = self._choices or (enum_class or ())
+        for member in members:
+            try:
+                self._by_value[self._value_key(member.value)] = member
+            except TypeError:
+                # Unhashable values cannot be looked up.
+                continue
+
+        if self.packed:
+            enum_classes = self._get_enum_classes()
+            if not enum_classes:
+                raise TypeError(
+                    f"Attribute '{self.public_attr_name}' cannot be packed, "
+                    f"type hint '{self._annotation}' is not a concrete Enum."
+                )
+            self._members = tuple(
+                member for enum_class in enum_classes for member in enum_class
+            )
+            if len(self._members) > self.MAX_PACKED_MEMBERS:
+                raise TypeError(
+                    f"Attribute '{self.public_attr_name}' cannot be packed, "
+                    f"enums with more than {self.MAX_PACKED_MEMBERS} members are not supported."
+                )
+            # Members of different enums can be equal, e.g. `IntEnum` members with the same value.
+            self._ordinals = {
+                (type(member), member): ordinal for ordinal, member in enumerate(self._members)
+            }
+            self._allocate_bits(owner, len(self._members))
 
     def validate(self, value: Enum) -> None:
         self._validate_optional(value)
 
         self._check_type(value)
+
+        if self._choices is not None:
+            self._validate_choices(value)
+
+    def coerce(self, value: Any) -> Any:
+        if isinstance(value, Enum):
+            return value
+
+        try:
+            return self._by_value.get(self._value_key(value), value)
+        except TypeError:
+            # Unhashable value.
+            return value
+
+    def _validate_choices(self, value: Enum) -> None:
+        if value not in cast(FrozenSet[Enum], self._choices):
+            raise ValueError(
+                self.ERROR_MSGS["choices"].format(
+                    attr_name=self.public_attr_name,
+                    value=value
+                )
+            )
+
+    def _value_key(self, value: Any) -> Any:
+        if not self.case_sensitive and isinstance(value, str):
+            return value.casefold()
+
+        return value
+
+    def _get_member(self, enum_class: Optional[type], choice: Any) -> Enum:
+        """Get the member for a choice given as a member or a raw value."""
+        if isinstance(choice, Enum):
+            return choice
+
+        if enum_class is None:
+            raise TypeError(
+                f"Attribute '{self.public_attr_name}' choices must be members, "
+                f"type hint '{self._annotation}' is not a concrete Enum."
+            )
+
+        return enum_class(choice)
+
+    def _get_enum_class(self) -> Optional[type]:
+        """Get the first concrete `Enum` subclass used in the type hint, if any."""
+        valid_classes = self._get_annotation_valid_classes()
+        if not isinstance(valid_classes, tuple):
+            valid_classes = (valid_classes, )
+
+        for valid_class in valid_classes:
+            if self._is_concrete_enum(valid_class):
+                return valid_class
+
+        return None
+
+    def _get_enum_classes(self) -> Tuple[type, ...]:
+        """Get every `Enum` subclass in the type hint, empty if one of them is not concrete."""
+        valid_classes = self._get_annotation_valid_classes()
+        if not isinstance(valid_classes, tuple):
+            valid_classes = (valid_classes, )
+
+        enum_classes = tuple(
+            valid_class for valid_class in valid_classes if valid_class is not type(None)
+        )
+        if not all(self._is_concrete_enum(enum_class) for enum_class in enum_classes):
+            return ()
+
+        return enum_classes
+
+    @staticmethod
+    def _is_concrete_enum(valid_class: Any) -> bool:
+        return (
+            isinstance(valid_class, type) and
+            issubclass(valid_class, Enum) and
+            valid_class is not Enum
+        )
+
+    def _encode(self, value: Enum) -> int:
+        return self._ordinals[(type(value), value)]
+
+    def _decode(self, code: int) -> Enum:
+        return self._members[code]
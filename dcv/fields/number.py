@@ -1,10 +1,27 @@
-from typing import Optional, Union, cast
-from decimal import Decimal
+from bisect import bisect_right
+from typing import Any, Callable, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union, cast
+from decimal import Context, Decimal, MAX_EMAX, MAX_PREC, MIN_EMIN
 from dcv.fields import Field, MISSING
+from dcv.fields.abstract import LIMIT_OPERATORS
+
+# Context used to scale `Decimal` values without rounding.
+_EXACT_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+Range = Tuple[Union[int, float, Decimal, None], Union[int, float, Decimal, None]]
+
 
 class NumberField(Field):
-    """Field validation for number values."""
-    __slots__ = ('gt', 'lt', 'ge', 'le')
+    """Field validation for number values.
+
+    `ranges` is a sequence of `(low, high)` inclusive intervals, `None` means unbounded.
+    Values must be within at least one of them. Intervals are sorted and merged
+    when the field is created and values are looked up with a binary search.
+
+    `coerce` converts strings to the number types allowed by the type hint,
+    chosen once when the field is assigned to a class. `int` is tried first,
+    then the other types in the order of the type hint.
+    """
+    __slots__ = ('gt', 'lt', 'ge', 'le', 'ranges', '_range_lows', '_range_highs', '_coercers')
 
     ERROR_MSGS = {
         "nan": "'{attr_name}' value '{value}' is not a number.",
@@ -12,6 +29,7 @@ class NumberField(Field):
         "lt": "'{attr_name}' value '{value}' must be less than {limit}.",
         "ge": "'{attr_name}' value '{value}' must be greater than or equals to {limit}.",
         "le": "'{attr_name}' value '{value}' must be less than or equals to {limit}.",
+        "ranges": "'{attr_name}' value '{value}' must be within one of the ranges {ranges}.",
     }
     TYPES = (int, float, complex, Decimal)
 
@@ -23,17 +41,41 @@ class NumberField(Field):
         gt: Union[int, float, complex, Decimal, None]=None,
         lt: Union[int, float, complex, Decimal, None]=None,
         ge: Union[int, float, complex, Decimal, None]=None,
-        le: Union[int, float, complex, Decimal, None]=None
+        le: Union[int, float, complex, Decimal, None]=None, *,
+        fast_read: bool=False,
+        default_factory: Optional[Callable[[], Any]]=None,
+        ranges: Optional[Sequence[Range]]=None
     ):
         super().__init__(
             default=default,
             optional=optional,
-            use_private_attr=use_private_attr
+            use_private_attr=use_private_attr,
+            fast_read=fast_read,
+            default_factory=default_factory
         )
         self.gt = gt
         self.lt = lt
         self.ge = ge
         self.le = le
+        self.ranges: Optional[Tuple[Range, ...]] = None
+        self._range_lows: Optional[List[Union[int, float, Decimal]]] = None
+        self._range_highs: Optional[List[Union[int, float, Decimal]]] = None
+        if ranges is not None:
+            self.ranges = self._merge_ranges(ranges)
+            self._range_lows = [float("-inf") if low is None else low for low, _ in self.ranges]
+            self._range_highs = [float("inf") if high is None else high for _, high in self.ranges]
+        self._coercers: Tuple[type, ...] = (int, float)
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        super().__set_name__(owner, name)
+        valid_classes = self._valid_classes
+        if not isinstance(valid_classes, tuple):
+            valid_classes = (valid_classes, )
+        # Subclasses such as `bool` are not converted, e.g. `bool("0")` is `True`.
+        self._coercers = tuple(sorted(
+            (number_type for number_type in valid_classes if number_type in NumberField.TYPES),
+            key=lambda number_type: number_type is not int
+        ))
 
     def validate(self, value: Union[int, float, complex, Decimal, None]) -> None:
         self._validate_optional(value)
@@ -52,6 +94,68 @@ class NumberField(Field):
         if self.le is not None:
             self._validate_le(value, self.le)
 
+        if self._range_lows is not None:
+            self._validate_ranges(value)
+
+    @staticmethod
+    def _merge_ranges(ranges: Sequence[Range]) -> Tuple[Range, ...]:
+        """Sort and merge overlapping intervals.
+
+        A `ValueError` is raised if there are no intervals or
+        an interval lower bound is greater than its upper bound.
+        """
+        if not ranges:
+            raise ValueError("At least one range is required.")
+
+        for low, high in ranges:
+            if low is not None and high is not None and low > high:
+                raise ValueError(
+                    f"Range ({low}, {high}) lower bound is greater than its upper bound."
+                )
+
+        merged: List[Range] = []
+        for low, high in sorted(
+            ranges, key=lambda interval: float("-inf") if interval[0] is None else interval[0]
+        ):
+            if merged:
+                previous_low, previous_high = merged[-1]
+                if previous_high is None or low is None or low <= previous_high:
+                    if previous_high is not None and (high is None or high > previous_high):
+                        merged[-1] = (previous_low, high)
+                    continue
+
+            merged.append((low, high))
+
+        return tuple(merged)
+
+    def _validate_ranges(self, value: Union[int, float, Decimal]) -> None:
+        lows = cast(List[Union[int, float, Decimal]], self._range_lows)
+        highs = cast(List[Union[int, float, Decimal]], self._range_highs)
+        if value != value:
+            raise ValueError(
+                self.ERROR_MSGS["nan"].format(attr_name=self.public_attr_name, value=value)
+            )
+
+        index = bisect_right(lows, value) - 1
+        if index < 0 or value > highs[index]:
+            raise ValueError(
+                self.ERROR_MSGS["ranges"].format(
+                    attr_name=self.public_attr_name,
+                    value=value,
+                    ranges=self.ranges
+                )
+            )
+
+    def coerce(self, value: Union[str, int, float, complex, Decimal]) -> Union[int, float, complex, Decimal, str]:
+        if isinstance(value, str):
+            for number_type in self._coercers:
+                try:
+                    return number_type(value)
+                except (ValueError, ArithmeticError):
+                    continue
+
+        return value
+
     def _validate_gt(
         self,
         value: Union[int, float, complex, Decimal],
@@ -110,16 +214,273 @@ class NumberField(Field):
 
 
 class IntField(NumberField):
+    """Field validation for `int` values.
+
+    If `choices` is set, values must be one of `choices`.
+    Membership is checked against a `frozenset` built once.
+    """
+    __slots__ = ('choices', '_choices')
+
+    ERROR_MSGS = {
+        **NumberField.ERROR_MSGS,
+        "choices": "'{attr_name}' value '{value}' is not a valid choice.",
+    }
     TYPES = (int, )
 
+    def __init__(
+        self,
+        default: Optional[int] = cast(int, MISSING),
+        optional: bool=False,
+        use_private_attr: bool=False,
+        gt: Union[int, float, Decimal, None]=None,
+        lt: Union[int, float, Decimal, None]=None,
+        ge: Union[int, float, Decimal, None]=None,
+        le: Union[int, float, Decimal, None]=None, *,
+        fast_read: bool=False,
+        default_factory: Optional[Callable[[], Any]]=None,
+        ranges: Optional[Sequence[Range]]=None,
+        choices: Optional[Iterable[int]]=None
+    ):
+        super().__init__(
+            default=default,
+            optional=optional,
+            use_private_attr=use_private_attr,
+            fast_read=fast_read,
+            default_factory=default_factory,
+            gt=gt,
+            lt=lt,
+            ge=ge,
+            le=le,
+            ranges=ranges
+        )
+        self.choices = None
+        self._choices: Optional[FrozenSet[int]] = None
+        if choices is not None:
+            self.choices = tuple(choices)
+            self._choices = frozenset(self.choices)
+
+    def validate(self, value: Optional[int]) -> None:
+        super().validate(value)
+
+        if self._choices is not None:
+            self._validate_choices(value)
+
+    def _validate_choices(self, value: Optional[int]) -> None:
+        if value not in cast(FrozenSet[int], self._choices):
+            raise ValueError(
+                self.ERROR_MSGS["choices"].format(
+                    attr_name=self.public_attr_name,
+                    value=value
+                )
+            )
+
+    def coerce(self, value: Union[str, int]) -> Union[int, str]:
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                pass
+
+        return value
+
 
 class FloatField(NumberField):
     TYPES = (float, )
 
+    def coerce(self, value: Union[str, float]) -> Union[float, str]:
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                pass
+
+        return value
+
 
 class DecimalField(NumberField):
+    """Field validation for `Decimal` values.
+
+    If `places` is set, values cannot have more than `places` decimal places.
+    Values are stored as an `int` scaled by `10 ** places`,
+    limits are checked against scaled `int` values and `Decimal` values are returned on read.
+
+    If `max_digits` is set, values cannot have more than `max_digits` digits
+    including `places` decimal places.
+    """
+    __slots__ = ('places', 'max_digits', '_scaled_limits', '_limits_adjusted')
+
+    ERROR_MSGS = {
+        **NumberField.ERROR_MSGS,
+        "places": "'{attr_name}' value '{value}' cannot have more than {places} decimal places.",
+        "max_digits": "'{attr_name}' value '{value}' cannot have more than {max_digits} digits.",
+    }
     TYPES = (Decimal, )
 
+    def __init__(
+        self,
+        default: Optional[Decimal] = cast(Decimal, MISSING),
+        optional: bool=False,
+        use_private_attr: bool=False,
+        gt: Union[int, float, Decimal, None]=None,
+        lt: Union[int, float, Decimal, None]=None,
+        ge: Union[int, float, Decimal, None]=None,
+        le: Union[int, float, Decimal, None]=None, *,
+        fast_read: bool=False,
+        default_factory: Optional[Callable[[], Any]]=None,
+        ranges: Optional[Sequence[Range]]=None,
+        places: Optional[int]=None,
+        max_digits: Optional[int]=None
+    ):
+        super().__init__(
+            default=default,
+            optional=optional,
+            use_private_attr=use_private_attr,
+            fast_read=fast_read,
+            default_factory=default_factory,
+            gt=gt,
+            lt=lt,
+            ge=ge,
+            le=le,
+            ranges=ranges
+        )
+        self.places = places
+        self.max_digits = max_digits
+        self._scaled_limits: tuple = ()
+        # Exponent of the most significant digit of the largest limit.
+        self._limits_adjusted = 0
+        if places is not None:
+            self._scaled_limits = tuple(
+                (limit_name, compare, limit, self._scale_limit(limit))
+                for limit_name, compare in LIMIT_OPERATORS
+                for limit in (getattr(self, limit_name),)
+                if limit is not None
+            )
+            self._limits_adjusted = max(
+                (Decimal(limit).adjusted() for _, _, limit, _ in self._scaled_limits), default=0
+            )
+
+    def validate(self, value: Optional[Decimal]) -> None:
+        if self.places is None and self.max_digits is None:
+            super().validate(value)
+            return
+
+        self._validate_decimal(value)
+
+    def _validate_decimal(self, value: Any) -> Optional[int]:
+        """Validate `value`, return it as a scaled `int` if `places` is set.
+
+        Sizes are checked from the exponent before building the `int`,
+        its cost grows with the exponent of the value.
+        """
+        self._validate_optional(value)
+
+        self._check_type(value)
+
+        if not value.is_finite():
+            raise ValueError(
+                self.ERROR_MSGS["nan"].format(attr_name=self.public_attr_name, value=value)
+            )
+
+        if self.places is None:
+            _, digits, exponent = value.as_tuple()
+            self._validate_max_digits(value, len(digits) + max(cast(int, exponent), 0))
+            super().validate(value)
+            return None
+
+        if value and self.max_digits is not None:
+            # Digits of the scaled value.
+            self._validate_max_digits(value, value.adjusted() + 1 + cast(int, self.places))
+
+        if self._scaled_limits and value.adjusted() > self._limits_adjusted:
+            # Larger than every limit, `Decimal` comparisons do not depend on the exponent.
+            self._validate_converted_limits(
+                value, value,
+                tuple((name, compare, limit, limit) for name, compare, limit, _ in self._scaled_limits)
+            )
+
+        scaled_value = self._to_int(value)
+
+        self._validate_converted_limits(value, scaled_value, self._scaled_limits)
+
+        if self._range_lows is not None:
+            self._validate_ranges(value)
+
+        return scaled_value
+
+    def _clean_for_storage(self, value: Any) -> Any:
+        """Return the scaled `int` computed by validation if `places` is set."""
+        if self.places is None:
+            return self._clean(value)
+
+        value = self._compute_default_value(value)
+        if self._check_value_is_optional_none(value):
+            return value
+
+        return self._validate_decimal(self.transform(value))
+
+    def _to_int(self, value: Decimal) -> int:
+        scaled = value.scaleb(cast(int, self.places), _EXACT_CONTEXT)
+        if scaled != scaled.to_integral_value():
+            raise ValueError(
+                self.ERROR_MSGS["places"].format(
+                    attr_name=self.public_attr_name,
+                    value=value,
+                    places=self.places
+                )
+            )
+
+        if not scaled:
+            return 0
+
+        return int(scaled)
+
+    def _from_int(self, value: int) -> Decimal:
+        return Decimal(value).scaleb(-cast(int, self.places), _EXACT_CONTEXT)
+
+    def _scale_limit(self, limit: Union[int, float, Decimal]) -> Union[int, Decimal]:
+        """Scale limit to compare it with scaled values, keep it as `Decimal` if not integral."""
+        scaled = Decimal(limit).scaleb(cast(int, self.places), _EXACT_CONTEXT)
+        if scaled == scaled.to_integral_value():
+            return int(scaled)
+
+        return scaled
+
+    def _has_plain_storage(self) -> bool:
+        return self.places is None and super()._has_plain_storage()
+
+    def _get_value(self, obj: Any) -> Any:
+        value = super()._get_value(obj)
+        if self.places is not None and type(value) is int:
+            return self._from_int(value)
+
+        return value
+
+    def _set_value(self, obj: Any, value: Any) -> None:
+        # Values from `_clean_for_storage` are already scaled.
+        if self.places is not None and value is not None and type(value) is not int:
+            value = self._to_int(value)
+
+        super()._set_value(obj, value)
+
+    def _validate_max_digits(self, value: Decimal, digits: int) -> None:
+        if self.max_digits is not None and digits > self.max_digits:
+            raise ValueError(
+                self.ERROR_MSGS["max_digits"].format(
+                    attr_name=self.public_attr_name,
+                    value=value,
+                    max_digits=self.max_digits
+                )
+            )
+
+    def coerce(self, value: Union[str, Decimal]) -> Union[Decimal, str]:
+        if isinstance(value, str):
+            try:
+                return Decimal(value)
+            except ArithmeticError:
+                pass
+
+        return value
+
 
 class ComplexField(NumberField):
     """Complex numbers cannot be compared."""
@@ -130,10 +491,23 @@ class ComplexField(NumberField):
         self,
         default: Optional[complex] = cast(complex, MISSING),
         optional: bool=False,
-        use_private_attr: bool=False
+        use_private_attr: bool=False, *,
+        fast_read: bool=False,
+        default_factory: Optional[Callable[[], Any]]=None
     ):
         super().__init__(
             default=default,
             optional=optional,
-            use_private_attr=use_private_attr
+            use_private_attr=use_private_attr,
+            fast_read=fast_read,
+            default_factory=default_factory
         )
+
+    def coerce(self, value: Union[str, complex]) -> Union[complex, str]:
+        if isinstance(value, str):
+            try:
+                return complex(value)
+            except ValueError:
+                pass
+
+        return value
@@ -0,0 +1,68 @@
+from typing import Any
+from dcv.fields.abstract import MISSING
+
+# Instance attribute holding the bits of every packed field.
+PACKED_ATTR_NAME = "_dcv_packed"
+# Class attribute counting the bits used by packed fields.
+PACKED_WIDTH_ATTR_NAME = "_dcv_packed_width"
+
+
+class PackedMixin:
+    """Store field values in bits of one `int` shared by every packed field of an instance.
+
+    Each field is given a range of bits when it is assigned to a class.
+    A code is stored in the field bits: `0` is used when the value has not been set,
+    `1` when the value is `None` and `2` onwards for the codes returned by `_encode`.
+
+    Fields using this mixin must define the `packed`, `_offset` and `_mask` slots
+    and implement `_encode` and `_decode`.
+    Updating the shared `int` is not atomic, packed fields of a single instance
+    should not be assigned concurrently from different threads.
+    """
+    __slots__ = ()
+
+    def _allocate_bits(self, owner: Any, codes: int) -> None:
+        """Reserve the bits needed to store `codes` different values in `owner`."""
+        width = (codes + 1).bit_length()
+        offset = getattr(owner, PACKED_WIDTH_ATTR_NAME, 0)
+        setattr(owner, PACKED_WIDTH_ATTR_NAME, offset + width)
+        self._offset = offset
+        self._mask = ((1 << width) - 1) << offset
+
+    def _has_plain_storage(self) -> bool:
+        return not self.packed and super()._has_plain_storage()
+
+    def _get_value(self, obj: Any) -> Any:
+        if not self.packed:
+            return super()._get_value(obj)
+
+        obj_dict = getattr(obj, "__dict__", None)
+        if obj_dict is None:
+            return MISSING
+
+        code = (obj_dict.get(PACKED_ATTR_NAME, 0) & self._mask) >> self._offset
+        if code == 0:
+            return MISSING
+        if code == 1:
+            return None
+
+        return self._decode(code - 2)
+
+    def _set_value(self, obj: Any, value: Any) -> None:
+        if not self.packed:
+            super()._set_value(obj, value)
+            return
+
+        code = 1 if value is None else self._encode(value) + 2
+        obj_dict = obj.__dict__
+        obj_dict[PACKED_ATTR_NAME] = (
+            (obj_dict.get(PACKED_ATTR_NAME, 0) & ~self._mask) | (code << self._offset)
+        )
+
+    def _delete_value(self, obj: Any) -> None:
+        if not self.packed:
+            super()._delete_value(obj)
+            return
+
+        obj_dict = obj.__dict__
+        obj_dict[PACKED_ATTR_NAME] = obj_dict.get(PACKED_ATTR_NAME, 0) & ~self._mask
@@ -1,18 +1,52 @@
 from dcv.fields import Field, MISSING
-from typing import Optional, Union, cast
+from dcv.fields.adaptive import AdaptiveChecks, check
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Union, cast
 import re
+import sys
+
+# Maximum number of characters or bytes of a rejected value shown in error messages.
+ERROR_VALUE_LENGTH = 64
 
 class TextField(Field):
-    """Field validation for string values."""
-    __slots__ = ('max_length', 'min_length', 'blank', 'trim', 'regex', 'compiled')
+    """Field validation for string values.
+
+    If `intern` is `True`, `str` values are interned with `sys.intern` after validation
+    so equal values share one object.
+    If `intern` is an `int`, `str` and `bytes` values are interned in a table owned
+    by the field which keeps at most `intern` values, the oldest values are evicted first.
+
+    If `choices` is set, values must be one of `choices`. Membership is checked
+    against a `frozenset` built once. If `case_sensitive` is `False` values are
+    compared case-insensitively.
+
+    If `adaptive` is set, constraints are checked in an order adapted to
+    their observed failure rate, see `AdaptiveChecks`.
+    By default constraints are always checked in the same order.
+
+    `bytearray` and `memoryview` values are validated without copying them,
+    the length of a `memoryview` is its number of bytes and `regex` must be
+    a `bytes` pattern to match bytes-like values.
+    `memoryview` values are trimmed by slicing them. If `trim_view` is set,
+    `bytes` and `bytearray` values are also trimmed into a `memoryview` slice
+    instead of a copy.
+    """
+    __slots__ = (
+        'max_length', 'min_length', 'blank', 'trim', 'regex', 'compiled',
+        'intern', '_intern_table', 'choices', 'case_sensitive', '_choices',
+        'adaptive', '_checks', 'trim_view', '_trim_bytes', '_max_bytes_choice_length'
+    )
 
     ERROR_MSGS = {
         "max_length": "'{attr_name}' length cannot be more than {length}.",
         "min_length": "'{attr_name}' length cannot be less than {length}.",
         "blank": "'{attr_name}' cannot be blank.",
         "regex": "'{attr_name}' does not match regex: {regex} .",
+        "choices": "'{attr_name}' value '{value}' is not a valid choice.",
     }
-    TYPES = (str, bytes)
+    TYPES = (str, bytes, bytearray, memoryview)
+
+    # Characters removed from bytes-like values when `trim` is `True`.
+    WHITESPACE = b" \t\n\r\x0b\x0c"
 
     def __init__(
         self,
@@ -21,29 +55,69 @@ class TextField(Field):
         use_private_attr: bool=False,
         max_length: Optional[int]=None,
         min_length: Optional[int]=None, *,
+        fast_read: bool=False,
+        default_factory: Optional[Callable[[], Any]]=None,
         blank: bool=False,
-        regex: Optional[str]=None,
-        trim: Union[str, bool]=False
+        regex: Union[str, bytes, None]=None,
+        trim: Union[str, bool]=False,
+        trim_view: bool=False,
+        intern: Union[bool, int]=False,
+        choices: Optional[Iterable[Union[str, bytes]]]=None,
+        case_sensitive: bool=True,
+        adaptive: bool=False
     ):
         super().__init__(
             default=default,
             optional=optional,
-            use_private_attr=use_private_attr
+            use_private_attr=use_private_attr,
+            fast_read=fast_read,
+            default_factory=default_factory
         )
         self.max_length = max_length
         self.min_length = min_length
         self.blank = blank
         self.trim = trim
+        self.trim_view = trim_view
+        self._trim_bytes = self.WHITESPACE
+        if isinstance(trim, str):
+            self._trim_bytes = trim.encode()
         self.regex = None
         if regex:
             self.regex = regex
             self.compiled: re.Pattern = re.compile(regex)
+        self.intern = intern
+        self._intern_table: Optional[Dict[Union[str, bytes], Union[str, bytes]]] = None
+        if intern is not True and intern:
+            self._intern_table = {}
+        self.choices = None
+        self.case_sensitive = case_sensitive
+        self._choices: Optional[FrozenSet[Union[str, bytes]]] = None
+        # Longer bytes-like values are rejected without copying them.
+        self._max_bytes_choice_length = -1
+        if choices is not None:
+            self.choices = tuple(choices)
+            self._choices = frozenset(
+                choice if case_sensitive else self._fold(choice)
+                for choice in self.choices
+            )
+            self._max_bytes_choice_length = max(
+                (len(choice) for choice in self.choices if isinstance(choice, bytes)),
+                default=-1
+            )
+        self.adaptive = adaptive
+        self._checks: Optional[AdaptiveChecks] = None
+        if adaptive:
+            self._checks = self._build_adaptive_checks()
 
     def validate(self, value: str) -> None:
         self._validate_optional(value)
 
         self._check_type(value)
 
+        if self._checks is not None:
+            self._checks.run(value)
+            return
+
         self._validate_blank(value)
 
         if self.max_length is not None:
@@ -52,19 +126,100 @@ class TextField(Field):
         if self.min_length is not None:
             self._validate_min_length(value, self.min_length)
 
+        if self._choices is not None:
+            self._validate_choices(value)
+
         if self.regex is not None:
             self._validate_regex(value)
 
-    def transform(self, value: str) -> str:
+    def transform(self, value: Union[str, bytes, bytearray, memoryview]) -> Union[str, bytes, bytearray, memoryview]:
+        if not self.trim:
+            return value
+
+        if isinstance(value, memoryview) or (
+            self.trim_view and isinstance(value, (bytes, bytearray))
+        ):
+            return self._trim_memoryview(value)
+
+        if isinstance(value, (bytes, bytearray)):
+            return value.strip(None if self.trim is True else self._trim_bytes)
+
         if self.trim is True:
             return value.strip()
-        elif isinstance(self.trim, str):
-            return value.strip(self.trim)
 
+        return value.strip(cast(str, self.trim))
+
+    def _trim_memoryview(self, value: Union[bytes, bytearray, memoryview]) -> memoryview:
+        """Slice leading and trailing trim characters without copying."""
+        view = memoryview(value)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+
+        chars = self._trim_bytes
+        start, end = 0, view.nbytes
+        while start < end and view[start] in chars:
+            start += 1
+        while end > start and view[end - 1] in chars:
+            end -= 1
+
+        return view[start:end]
+
+    @staticmethod
+    def _length(value: Union[str, bytes, bytearray, memoryview]) -> int:
+        if isinstance(value, memoryview):
+            return value.nbytes
+
+        return len(value)
+
+    def _build_adaptive_checks(self) -> AdaptiveChecks:
+        checks = [check("blank", 1, self._validate_blank)]
+
+        if self.max_length is not None:
+            checks.append(check("max_length", 1, self._validate_max_length, self.max_length))
+
+        if self.min_length is not None:
+            checks.append(check("min_length", 1, self._validate_min_length, self.min_length))
+
+        if self._choices is not None:
+            checks.append(check("choices", 2, self._validate_choices))
+
+        if self.regex is not None:
+            checks.append(check("regex", 10, self._validate_regex))
+
+        return AdaptiveChecks(checks)
+
+    def _set_value(self, obj: Any, value: Any) -> None:
+        if self.intern and value is not None:
+            value = self._intern(value)
+
+        super()._set_value(obj, value)
+
+    def _intern(self, value: Union[str, bytes]) -> Union[str, bytes]:
+        table = self._intern_table
+        if table is None:
+            if type(value) is str:
+                return sys.intern(value)
+            return value
+
+        if type(value) is not str and type(value) is not bytes:
+            return value
+
+        interned = table.get(value)
+        if interned is not None:
+            return interned
+
+        if len(table) >= self.intern:
+            try:
+                del table[next(iter(table))]
+            except (KeyError, RuntimeError, StopIteration):
+                # Another thread changed the table, the value is still interned.
+                pass
+
+        table[value] = value
         return value
 
     def _validate_max_length(self, value: str, max_length: int) -> None:
-        if len(value) > max_length:
+        if self._length(value) > max_length:
             raise ValueError(
                 self.ERROR_MSGS["max_length"].format(
                     attr_name=self.public_attr_name,
@@ -73,7 +228,7 @@ class TextField(Field):
             )
 
     def _validate_min_length(self, value: str, min_length: int) -> None:
-        if len(value) < min_length:
+        if self._length(value) < min_length:
             raise ValueError(
                 self.ERROR_MSGS["min_length"].format(
                     attr_name=self.public_attr_name,
@@ -81,9 +236,40 @@ class TextField(Field):
                 )
             )
     def _validate_blank(self, value: str) -> None:
-        if not self.blank and not len(value):
+        if not self.blank and not self._length(value):
             raise ValueError(self.ERROR_MSGS["blank"].format(attr_name=self.public_attr_name))
 
+    def _validate_choices(self, value: Union[str, bytes, bytearray, memoryview]) -> None:
+        if isinstance(value, (bytearray, memoryview)):
+            if self._length(value) > self._max_bytes_choice_length:
+                self._raise_invalid_choice(value)
+            # Unhashable, only values as short as a choice are copied.
+            value = bytes(value)
+
+        key = value if self.case_sensitive else self._fold(value)
+        if key not in cast(FrozenSet[Union[str, bytes]], self._choices):
+            self._raise_invalid_choice(value)
+
+    def _raise_invalid_choice(self, value: Union[str, bytes, bytearray, memoryview]) -> None:
+        shown: Union[str, bytes, bytearray, memoryview] = value[:ERROR_VALUE_LENGTH]
+        if isinstance(shown, memoryview):
+            shown = shown.tobytes()
+
+        raise ValueError(
+            self.ERROR_MSGS["choices"].format(
+                attr_name=self.public_attr_name,
+                value=f"{shown!s}..." if len(value) > ERROR_VALUE_LENGTH else shown
+            )
+        )
+
+    @staticmethod
+    def _fold(value: Union[str, bytes]) -> Union[str, bytes]:
+        """Normalize case for case-insensitive comparisons."""
+        if isinstance(value, str):
+            return value.casefold()
+
+        return value.lower()
+
     def _validate_regex(self, value: str) -> None:
         if self.regex and not self.compiled.match(value):
             raise ValueError(
@@ -0,0 +1,159 @@
+"""Helpers working on instances of dataclasses using `dcv` fields."""
+from copy import deepcopy
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+from dcv.fields.abstract import CHANGES_ATTR_NAME, VALIDATORS_ATTR_NAME, get_dependents
+from dcv.validators import CrossFieldValidator
+from dcv.utils import get_fields
+
+T = TypeVar("T")
+
+# Values of these types are shared instead of copied by `deepcopy`.
+IMMUTABLE_TYPES = frozenset((
+    type(None), bool, int, float, complex, str, bytes, Decimal,
+    datetime, date, time, timedelta,
+))
+
+
+def fast_copy(cls: Type[T]) -> Type[T]:
+    """Class decorator to copy and pickle instances without validating them again.
+
+    Stored values, including the private attributes and packed bits used by
+    `dcv` fields, are transferred directly to the new instance,
+    `__init__` and `Field.__set__` are not called because values were already validated.
+    `copy.deepcopy` shares immutable values and deep copies everything else.
+
+    Use it on top of `@dataclass`.
+    """
+    setattr(cls, "__reduce__", _reduce)
+    setattr(cls, "__copy__", _copy)
+    setattr(cls, "__deepcopy__", _deepcopy)
+    return cls
+
+
+def _reconstruct(cls: Type[T], state: Dict[str, Any]) -> T:
+    """Create an instance of `cls` from its stored values."""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    if CHANGES_ATTR_NAME in state:
+        obj.__dict__[CHANGES_ATTR_NAME] = dict(state[CHANGES_ATTR_NAME])
+    return obj
+
+
+def _reduce(self: Any) -> Tuple[Any, Tuple[type, Dict[str, Any]]]:
+    return (_reconstruct, (type(self), self.__dict__))
+
+
+def _copy(self: T) -> T:
+    return _reconstruct(type(self), self.__dict__)
+
+
+def _deepcopy(self: T, memo: Optional[Dict[int, Any]]=None) -> T:
+    if memo is None:
+        memo = {}
+
+    obj = type(self).__new__(type(self))
+    memo[id(self)] = obj
+    obj_dict = obj.__dict__
+    for name, value in self.__dict__.items():
+        if type(value) in IMMUTABLE_TYPES or isinstance(value, Enum):
+            obj_dict[name] = value
+        else:
+            obj_dict[name] = deepcopy(value, memo)
+
+    return obj
+
+
+def replace(obj: T, **changes: Any) -> T:
+    """Create a new instance of `obj` with the values in `changes`.
+
+    Works like `dataclasses.replace` but values not in `changes` are copied
+    from `obj` without validating them again, `__init__` and `__post_init__` are not called.
+    Only the values in `changes` are validated, and the cross-field validators
+    using them run once after every value has been set.
+    A new instance has no tracked changes.
+    """
+    cls = type(obj)
+    dc_fields = getattr(cls, "__dataclass_fields__")
+    dcv_fields = get_fields(cls)
+    new = _reconstruct(cls, obj.__dict__)
+
+    validators: Dict[CrossFieldValidator, None] = {}
+    for name, value in changes.items():
+        dc_field = dc_fields.get(name)
+        if dc_field is None:
+            raise TypeError(f"{cls.__name__} has no field '{name}'.")
+        if not dc_field.init:
+            raise ValueError(
+                f"field {name} is declared with init=False, it cannot be specified with replace()"
+            )
+
+        field = dcv_fields.get(name)
+        if field is None:
+            object.__setattr__(new, name, value)
+            continue
+
+        field._set_value(new, field._clean_for_storage(value))
+        if field._has_dependents:
+            field._invalidate_dependents(new)
+        validators.update(dict.fromkeys(get_dependents(cls, VALIDATORS_ATTR_NAME, name)))
+
+    for validator in validators:
+        if validator.is_ready(new):
+            validator(new)
+
+    if CHANGES_ATTR_NAME in new.__dict__:
+        new.__dict__[CHANGES_ATTR_NAME] = {}
+
+    return new
+
+
+def track_changes(cls: Type[T]) -> Type[T]:
+    """Class decorator to record which fields are set after an instance is created.
+
+    Only `dcv` fields are tracked. Values set while the instance is created,
+    including in `__post_init__`, are not changes.
+    Use `changed_fields` and `changes` to get the fields set since the instance
+    was created or `mark_clean` was called.
+
+    Use it on top of `@dataclass`. Subclasses must be decorated too.
+    """
+    for field in get_fields(cls).values():
+        field._track_changes = True
+
+    init: Callable[..., None] = getattr(cls, "__init__")
+
+    @wraps(init)
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        init(self, *args, **kwargs)
+        self.__dict__[CHANGES_ATTR_NAME] = {}
+
+    setattr(cls, "__init__", __init__)
+    return cls
+
+
+def _get_changes(obj: Any) -> Dict[str, None]:
+    try:
+        return obj.__dict__[CHANGES_ATTR_NAME]
+    except (AttributeError, KeyError):
+        raise TypeError(
+            f"Changes of {type(obj).__name__} are not tracked, use 'dcv.track_changes'."
+        ) from None
+
+
+def changed_fields(obj: Any) -> Tuple[str, ...]:
+    """Names of the fields set since `obj` was created or marked clean, in the order first set."""
+    return tuple(_get_changes(obj))
+
+
+def changes(obj: Any) -> Dict[str, Any]:
+    """Map the fields set since `obj` was created or marked clean to their current value."""
+    return {name: getattr(obj, name) for name in _get_changes(obj)}
+
+
+def mark_clean(obj: Any) -> None:
+    """Forget the fields set in `obj` so far, e.g. after saving it."""
+    _get_changes(obj).clear()
@@ -0,0 +1,232 @@
+"""Build dataclasses using `dcv` fields from mappings."""
+from dataclasses import MISSING as DC_MISSING, fields
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, cast
+from weakref import WeakKeyDictionary
+from dcv.exceptions import ValidationError
+from dcv.fields import Field, MISSING
+from dcv.fields.abstract import VALIDATORS_ATTR_NAME, FastReadField, get_dependents
+from dcv.utils import get_fields
+from dcv.validators import CrossFieldValidator
+
+T = TypeVar("T")
+
+Coercer = Callable[[Any], Any]
+# (name, init, coercer)
+Plan = List[Tuple[str, bool, Optional[Coercer]]]
+
+_PLANS: "WeakKeyDictionary[type, Plan]" = WeakKeyDictionary()
+
+# (name, field, required, coercer) and the cross-field validators.
+ValidationPlan = Tuple[
+    List[Tuple[str, Optional[Field], bool, Optional[Coercer]]],
+    Tuple[CrossFieldValidator, ...]
+]
+
+_VALIDATION_PLANS: "WeakKeyDictionary[type, ValidationPlan]" = WeakKeyDictionary()
+
+
+def from_dict(cls: Type[T], data: Mapping[str, Any], coerce: bool=False) -> T:
+    """Instantiate `cls` with the values in `data`.
+
+    Keys in `data` which are not fields of `cls` are ignored.
+    Values for fields with `init=False` are assigned after instantiation.
+
+    If `coerce` is `True` string values are converted using the `coerce`
+    method of the `dcv` field managing them, e.g. `"1"` becomes `1` for an `IntField`.
+    The coercer of every field is selected once per class.
+    """
+    init_kwargs = {}
+    non_init = []
+    for name, init, coercer in _get_plan(cls):
+        try:
+            value = data[name]
+        except KeyError:
+            continue
+
+        if coerce and coercer is not None:
+            value = coercer(value)
+
+        if init:
+            init_kwargs[name] = value
+        else:
+            non_init.append((name, value))
+
+    obj = cls(**init_kwargs)
+
+    for name, value in non_init:
+        setattr(obj, name, value)
+
+    return obj
+
+
+def validate_mapping(cls: Type[Any], data: Mapping[str, Any], coerce: bool=False) -> Dict[str, Any]:
+    """Validate the values in `data` as fields of `cls` without creating an instance.
+
+    Returns a new `dict` with the transformed value of every field of `cls` in `data`,
+    keys which are not fields of `cls` are ignored.
+    Missing fields which are required by `__init__` are errors.
+    Cross-field validators run last for every validator whose fields are all valid and set.
+    `self` is a lightweight object holding the values and defaults of the fields,
+    with the methods, properties and computed fields of `cls` bound to it,
+    no instance of `cls` is created. Any exception raised by a validator is reported as an error.
+
+    A `ValidationError` with every error found is raised if `data` is not valid.
+    `coerce` works like in `from_dict`.
+    """
+    plan, validators = _get_validation_plan(cls)
+    values: Dict[str, Any] = {}
+    errors: Dict[str, Exception] = {}
+
+    for name, field, required, coercer in plan:
+        try:
+            value = data[name]
+        except KeyError:
+            if required:
+                errors[name] = TypeError(f"missing required field: '{name}'")
+            continue
+
+        if field is None:
+            values[name] = value
+            continue
+
+        if coerce and coercer is not None:
+            value = coercer(value)
+
+        try:
+            values[name] = field._clean(value)
+        except (TypeError, ValueError) as error:
+            errors[name] = error
+
+    if validators:
+        _run_validators(cls, plan, validators, values, errors)
+
+    if errors:
+        raise ValidationError(errors)
+
+    return values
+
+
+def _run_validators(
+    cls: Type[Any],
+    plan: List[Tuple[str, Optional[Field], bool, Optional[Coercer]]],
+    validators: Tuple[CrossFieldValidator, ...],
+    values: Dict[str, Any],
+    errors: Dict[str, Exception]
+) -> None:
+    view_values = dict(values)
+    for name, field, _, _ in plan:
+        if field is None or name in values or name in errors:
+            continue
+
+        if field.default_factory is not None:
+            if not field.fast_read:
+                # Lazy defaults are not computed for validators, like in instances.
+                continue
+            try:
+                view_values[name] = field._clean(field.default_factory())
+            except (TypeError, ValueError) as error:
+                errors[name] = error
+        elif field.optional:
+            view_values[name] = field._compute_default_value(MISSING)
+
+    view = _ValidatorView(cls, view_values)
+    for validator in validators:
+        if (
+            any(name in errors for name in validator.names) or
+            not validator.is_ready_for(view_values)
+        ):
+            continue
+
+        try:
+            validator(view)
+        except Exception as error:
+            errors[cast(str, validator.public_attr_name)] = error
+
+
+class _ValidatorView:
+    """Object given as `self` to cross-field validators by `validate_mapping`.
+
+    Field values are stored in its `__dict__`, other attributes of `cls`
+    such as methods, properties and computed fields are bound to it.
+    No instance of `cls` is created and `dcv` fields are not used.
+    """
+    __slots__ = ('_view_cls', '__dict__')
+
+    def __init__(self, cls: Type[Any], values: Dict[str, Any]) -> None:
+        self._view_cls = cls
+        self.__dict__.update(values)
+
+    def __getattr__(self, name: str) -> Any:
+        cls = self._view_cls
+        for klass in cls.__mro__:
+            if name in vars(klass):
+                attribute = vars(klass)[name]
+                break
+        else:
+            raise AttributeError(f"'{cls.__name__}' object has no attribute '{name}'")
+
+        if isinstance(attribute, (Field, FastReadField)):
+            raise AttributeError(f"Attribute {name} on object {cls.__name__} has not been set.")
+
+        if hasattr(type(attribute), "__get__"):
+            return attribute.__get__(self, cls)
+
+        return attribute
+
+
+def _get_validation_plan(cls: type) -> ValidationPlan:
+    try:
+        return _VALIDATION_PLANS[cls]
+    except KeyError:
+        pass
+
+    dcv_fields = get_fields(cls)
+    plan = []
+    validators: Dict[CrossFieldValidator, None] = {}
+    for dc_field in fields(cls):
+        field = dcv_fields.get(dc_field.name)
+        if field is None:
+            required = (
+                dc_field.init and
+                dc_field.default is DC_MISSING and
+                dc_field.default_factory is DC_MISSING
+            )
+        else:
+            required = (
+                dc_field.init and
+                not field.optional and
+                field.default_factory is None
+            )
+            validators.update(
+                dict.fromkeys(get_dependents(cls, VALIDATORS_ATTR_NAME, dc_field.name))
+            )
+
+        plan.append((dc_field.name, field, required, _get_coercer(field)))
+
+    validation_plan = (plan, tuple(validators))
+    _VALIDATION_PLANS[cls] = validation_plan
+    return validation_plan
+
+
+def _get_coercer(field: Optional[Field]) -> Optional[Coercer]:
+    """Return the field's `coerce` method only if the field implements it."""
+    if field is None or type(field).coerce is Field.coerce:
+        return None
+
+    return field.coerce
+
+
+def _get_plan(cls: type) -> Plan:
+    try:
+        return _PLANS[cls]
+    except KeyError:
+        pass
+
+    dcv_fields = get_fields(cls)
+    plan: Plan = [
+        (dc_field.name, dc_field.init, _get_coercer(dcv_fields.get(dc_field.name)))
+        for dc_field in fields(cls)
+    ]
+
+    _PLANS[cls] = plan
+    return plan
@@ -0,0 +1,126 @@
+"""Create dataclasses using `dcv` fields from declarative specs."""
+import threading
+from collections import OrderedDict
+from dataclasses import make_dataclass
+from typing import Any, Hashable, Mapping, Optional, Type, Union
+import dcv.fields
+from dcv.fields import Field
+
+# Maximum number of classes kept by `build_model`, the least recently used are evicted first.
+MODEL_CACHE_SIZE = 256
+
+_MODELS: "OrderedDict[Hashable, type]" = OrderedDict()
+_MODELS_LOCK = threading.Lock()
+
+
+def build_model(name: str, spec: Mapping[str, Mapping[str, Any]]) -> type:
+    """Create a dataclass named `name` with a `dcv` field for every entry in `spec`.
+
+    Every entry maps a field name to a mapping with:
+        - `field`: name of a field in `dcv.fields` or a `Field` subclass.
+        - `type`: optional type hint, by default the field `TYPES`,
+          wrapped in `Optional` if the field is optional.
+        - any other key is passed to the field.
+
+    ```python
+    Item = build_model("Item", {
+        "name": {"field": "TextField", "max_length": 20},
+        "qty": {"field": "IntField", "ge": 0, "default": 1},
+    })
+    ```
+
+    Fields are keyword-only in `__init__`.
+    Classes are cached by the contents of `name` and `spec`, building an equal
+    spec again returns the same class without creating new fields.
+    At most `MODEL_CACHE_SIZE` classes are kept. Specs with unhashable values,
+    other than mappings, lists, tuples and sets, are not cached.
+    """
+    try:
+        key = (name, tuple(
+            (field_name, _freeze(field_spec)) for field_name, field_spec in spec.items()
+        ))
+    except TypeError:
+        # Specs with values which cannot be compared safely are not cached.
+        return _make_model(name, spec)
+
+    with _MODELS_LOCK:
+        model = _MODELS.get(key)
+        if model is not None:
+            _MODELS.move_to_end(key)
+            return model
+
+    model = _make_model(name, spec)
+
+    with _MODELS_LOCK:
+        # Another thread may have built the same spec meanwhile, keep a single class.
+        model = _MODELS.setdefault(key, model)
+        _MODELS.move_to_end(key)
+        while len(_MODELS) > MODEL_CACHE_SIZE:
+            _MODELS.popitem(last=False)
+
+    return model
+
+
+def clear_models() -> None:
+    """Remove every class cached by `build_model`."""
+    with _MODELS_LOCK:
+        _MODELS.clear()
+
+
+def _make_model(name: str, spec: Mapping[str, Mapping[str, Any]]) -> type:
+    fields = []
+    for field_name, field_spec in spec.items():
+        options = dict(field_spec)
+        try:
+            field_class = _get_field_class(options.pop("field"))
+        except KeyError:
+            raise TypeError(f"Field '{field_name}' does not have a 'field' class.") from None
+
+        type_hint = options.pop("type", None)
+        field = field_class(**options)
+        if type_hint is None:
+            type_hint = _infer_type(field)
+
+        fields.append((field_name, type_hint, field))
+
+    return make_dataclass(name, fields, kw_only=True)
+
+
+def _get_field_class(field_class: Union[str, Type[Field]]) -> Type[Field]:
+    if isinstance(field_class, str):
+        if field_class not in dcv.fields.__all__:
+            raise TypeError(f"Unknown field '{field_class}'.")
+        field_class = getattr(dcv.fields, field_class)
+
+    if not isinstance(field_class, type) or not issubclass(field_class, Field):
+        raise TypeError(f"{field_class!r} is not a field class.")
+
+    return field_class
+
+
+def _infer_type(field: Field) -> Any:
+    types = field.TYPES
+    type_hint = Union[types] if len(types) > 1 else types[0]
+    if field.optional:
+        return Optional[type_hint]
+
+    return type_hint
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable key equal only for equal specs.
+
+    Types are part of the key, so e.g. `1` and `1.0` give different keys.
+    A `TypeError` is raised for values which cannot be hashed and are not containers.
+    """
+    if isinstance(value, Mapping):
+        return (dict, tuple(sorted(
+            ((_freeze(key), _freeze(item)) for key, item in value.items()), key=repr
+        )))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(item) for item in value))
+
+    hash(value)
+    return (type(value), value)
@@ -0,0 +1,310 @@
+"""Validate NumPy structured arrays and memory-mapped record files.
+
+NumPy is not a dependency of `dcv`, it is imported when these functions are called.
+"""
+import math
+import os
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Union
+from dcv.fields import (
+    Field, BoolField, IntField, FloatField, NumberField, ComplexField, TextField,
+    DateTimeBaseField, DateTimeField, DateField, TimeDeltaField
+)
+from dcv.utils import get_fields
+
+# Number of records validated at once, bounding the memory used by temporary arrays.
+CHUNK_SIZE = 65536
+
+_NUMBER_VALIDATORS = (NumberField.validate, IntField.validate)
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required to validate records, install 'numpy'.") from None
+
+    return numpy
+
+
+def record_dtype(cls: type) -> Any:
+    """Build the NumPy structured dtype with one column per `dcv` field of `cls`.
+
+    `TextField` columns are fixed width and require `max_length`,
+    they are `str` columns if the type hint allows `str` and `bytes` columns otherwise.
+    A `TypeError` is raised for fields without a fixed size representation,
+    e.g. `DecimalField` or `EnumField`, pass a `dtype` to `validate_records` instead.
+    """
+    np = _import_numpy()
+    return np.dtype([
+        (name, _field_dtype(field)) for name, field in get_fields(cls).items()
+    ])
+
+
+def _field_dtype(field: Field) -> str:
+    if isinstance(field, BoolField):
+        return "?"
+    if isinstance(field, IntField):
+        return "<i8"
+    if isinstance(field, FloatField):
+        return "<f8"
+    if isinstance(field, ComplexField):
+        return "<c16"
+    if isinstance(field, DateTimeField):
+        return "<M8[us]"
+    if isinstance(field, DateField):
+        return "<M8[D]"
+    if isinstance(field, TimeDeltaField):
+        return "<m8[us]"
+    if isinstance(field, TextField) and field.max_length is not None:
+        kind = "U" if _is_str_field(field) else "S"
+        return f"{kind}{field.max_length}"
+
+    raise TypeError(
+        f"Attribute '{field.public_attr_name}' cannot be mapped to a NumPy dtype."
+    )
+
+
+def _is_str_field(field: TextField) -> bool:
+    valid_classes = field._get_annotation_valid_classes()
+    if not isinstance(valid_classes, tuple):
+        valid_classes = (valid_classes,)
+
+    return any(
+        isinstance(valid_class, type) and issubclass(valid_class, str)
+        for valid_class in valid_classes
+    )
+
+
+def validate_records(
+    cls: type,
+    source: Union[str, os.PathLike, Any],
+    dtype: Any=None,
+    chunk_size: int=CHUNK_SIZE
+) -> Dict[str, Any]:
+    """Validate every record of a NumPy structured array or record file against `cls`.
+
+    `source` is a structured array or the path of a file of fixed size records,
+    which is memory-mapped read-only so it is never loaded whole.
+    `dtype` is the layout of the records, `record_dtype(cls)` by default.
+    Columns are named after the fields of `cls`, columns which are not fields are ignored.
+
+    Records are validated in chunks of `chunk_size`. Constraints of `IntField`,
+    `FloatField`, `TextField` and date and time fields are checked on whole columns,
+    other fields and fields using `regex`, `trim`, case-insensitive `choices`
+    or overriding `validate` are checked value by value.
+    Cross-field validators are not run.
+
+    Returns a `dict` mapping the name of every field with invalid values
+    to an array of the indices of the invalid records, empty if every record is valid.
+    """
+    np = _import_numpy()
+    if dtype is None:
+        dtype = record_dtype(cls)
+
+    if isinstance(source, (str, bytes, os.PathLike)):
+        array = np.memmap(source, dtype=dtype, mode="r")
+    else:
+        array = source
+
+    dcv_fields = get_fields(cls)
+    names = array.dtype.names or ()
+    for name, field in dcv_fields.items():
+        if name not in names and not field.optional and field.default_factory is None:
+            raise TypeError(f"Records do not have a column for field '{name}'.")
+
+    invalid: Dict[str, List[Any]] = {name: [] for name in names if name in dcv_fields}
+    for start in range(0, len(array), chunk_size):
+        chunk = array[start:start + chunk_size]
+        for name, indices in invalid.items():
+            mask = _invalid_rows(np, dcv_fields[name], chunk[name])
+            if mask.any():
+                indices.append(np.flatnonzero(mask) + start)
+
+    return {name: np.concatenate(indices) for name, indices in invalid.items() if indices}
+
+
+def _invalid_rows(np: Any, field: Field, column: Any) -> Any:
+    """Boolean mask of the invalid values of `column`."""
+    field_type = type(field)
+    kind = column.dtype.kind
+
+    if (isinstance(field, (IntField, FloatField)) and
+            field_type.validate in _NUMBER_VALIDATORS and
+            field_type.transform is Field.transform and
+            kind in ("iu" if isinstance(field, IntField) else "f")):
+        return _invalid_numbers(np, field, column)
+
+    if (isinstance(field, TextField) and
+            field_type.validate is TextField.validate and
+            field_type.transform is TextField.transform and
+            not field.trim and field.regex is None and
+            (field.case_sensitive or field._choices is None) and
+            kind == ("U" if _is_str_field(field) else "S")):
+        return _invalid_texts(np, field, column)
+
+    if (isinstance(field, (DateTimeField, DateField, TimeDeltaField)) and
+            field_type.validate is DateTimeBaseField.validate and
+            field_type.transform is DateTimeBaseField.transform and
+            column.dtype == np.dtype(_field_dtype(field))):
+        mask = _invalid_datetimes(np, field, column)
+        if mask is not None:
+            return mask
+
+    return _invalid_values(np, field, column)
+
+
+def _invalid_numbers(np: Any, field: NumberField, column: Any) -> Any:
+    if column.dtype.kind in "iu":
+        return _invalid_integers(np, field, column)
+
+    mask = np.zeros(len(column), dtype=bool)
+    for name, compare in (
+        ("gt", np.greater), ("lt", np.less), ("ge", np.greater_equal), ("le", np.less_equal)
+    ):
+        limit = getattr(field, name)
+        if limit is not None:
+            if isinstance(limit, Decimal):
+                limit = float(limit)
+            mask |= ~compare(column, limit)
+
+    if field._range_lows is not None:
+        lows = np.array([float(low) for low in field._range_lows])
+        highs = np.array([float(high) for high in field._range_highs])
+        index = np.searchsorted(lows, column, side="right") - 1
+        mask |= (index < 0) | (column > highs[np.maximum(index, 0)])
+        mask |= np.isnan(column)
+
+    return mask
+
+
+def _invalid_integers(np: Any, field: NumberField, column: Any) -> Any:
+    """Check limits of an integer column in its own dtype, so large limits stay exact.
+
+    Limits are rounded to the nearest integers inside the interval they bound
+    and clipped to the range of the dtype.
+    """
+    info = np.iinfo(column.dtype)
+    low, high = int(info.min), int(info.max)
+    for name, round_up, offset in (("gt", False, 1), ("ge", True, 0)):
+        bound = _integer_bound(getattr(field, name), round_up)
+        if bound is not None:
+            low = max(low, bound + offset)
+    for name, round_up, offset in (("lt", True, -1), ("le", False, 0)):
+        bound = _integer_bound(getattr(field, name), round_up)
+        if bound is not None:
+            high = min(high, bound + offset)
+
+    if low > high:
+        return np.ones(len(column), dtype=bool)
+
+    mask = (column < np.array(low, dtype=column.dtype)) | (
+        column > np.array(high, dtype=column.dtype)
+    )
+
+    if field._range_lows is not None:
+        ranges = []
+        for range_low, range_high in zip(field._range_lows, field._range_highs):
+            range_low = _integer_bound(range_low, True)
+            range_high = _integer_bound(range_high, False)
+            range_low = int(info.min) if range_low is None else max(range_low, int(info.min))
+            range_high = int(info.max) if range_high is None else min(range_high, int(info.max))
+            if range_low <= range_high:
+                ranges.append((range_low, range_high))
+
+        if not ranges:
+            return np.ones(len(column), dtype=bool)
+
+        lows = np.array([range_low for range_low, _ in ranges], dtype=column.dtype)
+        highs = np.array([range_high for _, range_high in ranges], dtype=column.dtype)
+        index = np.searchsorted(lows, column, side="right") - 1
+        mask |= (index < 0) | (column > highs[np.maximum(index, 0)])
+
+    if isinstance(field, IntField) and field.choices is not None:
+        mask |= ~np.isin(column, list(field.choices))
+
+    return mask
+
+
+def _integer_bound(limit: Any, round_up: bool) -> Optional[int]:
+    """`limit` rounded up or down to an integer, `None` if there is no limit or it is infinite."""
+    if limit is None:
+        return None
+
+    try:
+        return math.ceil(limit) if round_up else math.floor(limit)
+    except OverflowError:
+        return None
+
+
+def _invalid_texts(np: Any, field: TextField, column: Any) -> Any:
+    lengths = np.char.str_len(column)
+    mask = np.zeros(len(column), dtype=bool)
+    if not field.blank:
+        mask |= lengths == 0
+    if field.max_length is not None:
+        mask |= lengths > field.max_length
+    if field.min_length is not None:
+        mask |= lengths < field.min_length
+
+    if field.choices is not None:
+        choice_type = str if column.dtype.kind == "U" else bytes
+        choices = [choice for choice in field.choices if isinstance(choice, choice_type)]
+        if choices:
+            mask |= ~np.isin(column, np.array(choices))
+        else:
+            mask[:] = True
+
+    return mask
+
+
+def _invalid_datetimes(np: Any, field: DateTimeBaseField, column: Any) -> Optional[Any]:
+    """Check limits on the whole column, `None` if they cannot be compared as NumPy values."""
+    limits = []
+    for name, compare in (
+        ("gt", np.greater), ("lt", np.less), ("ge", np.greater_equal), ("le", np.less_equal)
+    ):
+        limit = getattr(field, name)
+        if limit is None:
+            continue
+
+        if isinstance(limit, datetime):
+            if limit.tzinfo is not None:
+                if field.tz is None:
+                    return None
+                limit = limit.astimezone(field.tz).replace(tzinfo=None)
+            limit = np.datetime64(limit, "us")
+        elif isinstance(limit, date):
+            limit = np.datetime64(limit, "D")
+        elif isinstance(limit, timedelta):
+            limit = np.timedelta64(limit // timedelta(microseconds=1), "us")
+        else:
+            return None
+
+        limits.append((compare, limit))
+
+    mask = np.zeros(len(column), dtype=bool)
+    for compare, limit in limits:
+        mask |= ~compare(column, limit)
+
+    if not field.optional:
+        mask |= np.isnat(column)
+
+    return mask
+
+
+def _invalid_values(np: Any, field: Field, column: Any) -> Any:
+    values = column.tolist()
+    return np.fromiter(
+        (not _is_valid(field, value) for value in values), dtype=bool, count=len(values)
+    )
+
+
+def _is_valid(field: Field, value: Any) -> bool:
+    try:
+        field._clean(value)
+    except (TypeError, ValueError):
+        return False
+
+    return True
@@ -0,0 +1,35 @@
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict
+from weakref import WeakKeyDictionary
+from dcv.fields.abstract import Field, FastReadField
+
+_FIELDS_CACHE: "WeakKeyDictionary[type, Dict[str, Field]]" = WeakKeyDictionary()
+
+
+def get_fields(cls: Any) -> Dict[str, Field]:
+    """Map every dataclass field name of `cls` to the `dcv` field managing it.
+
+    Dataclass fields not managed by a `dcv` field are not included.
+    The mapping is computed once per class and must not be modified.
+    """
+    try:
+        return _FIELDS_CACHE[cls]
+    except KeyError:
+        pass
+
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls!r} is not a dataclass.")
+
+    dcv_fields: Dict[str, Field] = {}
+    for dc_field in fields(cls):
+        for klass in cls.__mro__:
+            descriptor = vars(klass).get(dc_field.name)
+            if descriptor is not None:
+                if isinstance(descriptor, FastReadField):
+                    descriptor = descriptor.field
+                if isinstance(descriptor, Field):
+                    dcv_fields[dc_field.name] = descriptor
+                break
+
+    _FIELDS_CACHE[cls] = dcv_fields
+    return dcv_fields
@@ -0,0 +1,153 @@
+"""Validation rules using more than one field."""
+from functools import wraps
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from dcv.fields.abstract import (
+    VALIDATED_ATTR_NAME, VALIDATORS_ATTR_NAME, Field, MISSING,
+    get_class_attribute, register_dependent
+)
+
+Validator = Callable[[Any], None]
+
+
+def cross_field(*names: str) -> Callable[[Validator], "CrossFieldValidator"]:
+    """Decorator to validate the fields `names` of an instance together.
+
+    The decorated method receives the instance and must raise an exception,
+    usually a `ValueError`, when the values are not valid.
+    It runs from `__post_init__`, once `__init__` has set every field,
+    and every time one of `names` is set afterwards. Other validators are not run.
+    It is skipped while one of `names` has not been set, fields with a `default_factory`
+    do not compute their default for it.
+    If it fails after the instance is created the value set is reverted.
+
+    Use it in dataclasses, subclasses defining `__post_init__` must call
+    `super().__post_init__()`.
+
+    ```python
+    @dataclass
+    class Range:
+        start: int = IntField()
+        end: int = IntField()
+
+        @cross_field("start", "end")
+        def check_order(self):
+            if self.start >= self.end:
+                raise ValueError("'start' must be less than 'end'.")
+    ```
+    """
+    if not names:
+        raise TypeError("cross_field() needs at least one field name.")
+
+    def decorator(func: Validator) -> CrossFieldValidator:
+        return CrossFieldValidator(func, names)
+
+    return decorator
+
+
+class CrossFieldValidator:
+    """Validator registered for every field it uses in the class declaring it, see `cross_field`.
+
+    Subclasses inherit it, base and sibling classes sharing the fields do not run it.
+    """
+    __slots__ = ('func', 'names', 'public_attr_name', '_fields')
+
+    def __init__(self, func: Validator, names: Tuple[str, ...]) -> None:
+        self.func = func
+        self.names = names
+        self.public_attr_name: Optional[str] = None
+        self._fields: Tuple[Field, ...] = ()
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.public_attr_name = name
+        fields = []
+        for field_name in self.names:
+            field = get_class_attribute(owner, field_name)
+            if not isinstance(field, Field):
+                raise TypeError(
+                    f"Validator '{name}' uses '{field_name}' which is not a field."
+                )
+            fields.append(field)
+
+        self._fields = tuple(fields)
+        for field_name, field in zip(self.names, self._fields):
+            register_dependent(owner, VALIDATORS_ATTR_NAME, field_name, self)
+            field._has_dependents = True
+
+        _install_post_init(owner)
+
+    def __get__(self, obj: Any, objtype: Any=None) -> Any:
+        """Validators can be run manually from instances, e.g. `obj.check_order()`."""
+        if obj is None:
+            return self
+
+        return self.func.__get__(obj, objtype)
+
+    def __call__(self, obj: Any) -> None:
+        self.func(obj)
+
+    def is_ready(self, obj: Any) -> bool:
+        """Check if every field used has been set."""
+        for field in self._fields:
+            if field._get_value(obj) is MISSING:
+                return False
+
+        return True
+
+    def is_ready_for(self, values: Mapping[str, Any]) -> bool:
+        """Check if every field used is in `values`, see `dcv.validate_mapping`."""
+        for name in self.names:
+            if name not in values:
+                return False
+
+        return True
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(func={self.func!r}, names={self.names!r})"
+
+
+def run_validators(obj: Any) -> None:
+    """Run every cross-field validator of `obj` which is ready, once after it is created.
+
+    Assigning fields of `obj` runs their validators afterwards.
+    """
+    if VALIDATED_ATTR_NAME in obj.__dict__:
+        return
+
+    validators: Dict[CrossFieldValidator, None] = {}
+    for field_validators in getattr(type(obj), VALIDATORS_ATTR_NAME, {}).values():
+        validators.update(dict.fromkeys(field_validators))
+
+    for validator in validators:
+        if validator.is_ready(obj):
+            validator(obj)
+
+    obj.__dict__[VALIDATED_ATTR_NAME] = True
+
+
+def _install_post_init(owner: Any) -> None:
+    """Wrap the `__post_init__` of `owner` to run the validators after it.
+
+    Hooks inherited from bases run the validators of the class of the instance.
+    """
+    post_init = getattr(owner, "__post_init__", None)
+    if getattr(post_init, "_dcv_runs_validators", False):
+        return
+
+    if post_init is None:
+        setattr(owner, "__post_init__", _post_init)
+        return
+
+    @wraps(post_init)
+    def __post_init__(self: Any, *args: Any) -> None:
+        post_init(self, *args)
+        run_validators(self)
+
+    setattr(__post_init__, "_dcv_runs_validators", True)
+    setattr(owner, "__post_init__", __post_init__)
+
+
+def _post_init(self: Any, *args: Any) -> None:
+    run_validators(self)
+
+
+setattr(_post_init, "_dcv_runs_validators", True)
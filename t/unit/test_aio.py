@@ -0,0 +1,78 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import pytest
+from dcv.aio import validate_stream
+from dcv.exceptions import RecordError
+from dcv.fields import TextField, IntField
+
+
+@dataclass
+class T:
+    name: str = TextField(min_length=1)
+    number: int = IntField(ge=0)
+
+
+async def source(count):
+    for index in range(count):
+        await asyncio.sleep(0)
+        yield {"name": f"n{index}", "number": str(-1 if index % 10 == 3 else index)}
+
+
+async def collect(stream):
+    return [result async for result in stream]
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_validate_stream(use_executor):
+    """Validate an async stream.
+
+    GIVEN an async source of records
+    WHEN they are validated in batches
+    THEN instances and errors should be yielded in order
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = asyncio.run(collect(validate_stream(
+            T,
+            source(95),
+            batch_size=10,
+            concurrency=2,
+            executor=executor if use_executor else None,
+            coerce=True
+        )))
+
+    assert len(results) == 95
+    for index, result in enumerate(results):
+        if index % 10 == 3:
+            assert isinstance(result, RecordError)
+            assert result.index == index
+            assert isinstance(result.error, ValueError)
+        else:
+            assert result == T(name=f"n{index}", number=index)
+
+
+def test_validate_stream_backpressure():
+    """Bound in-flight batches.
+
+    GIVEN a source that records how many records were read
+    WHEN results are consumed slowly
+    THEN the source should not be read beyond the in-flight limit
+    """
+    read = []
+
+    def records():
+        for index in range(100):
+            read.append(index)
+            yield {"name": "x", "number": index}
+
+    async def first():
+        stream = validate_stream(T, records(), batch_size=5, concurrency=2)
+        result = await stream.__anext__()
+        await stream.aclose()
+        return result
+
+    assert asyncio.run(first()).number == 0
+    assert len(read) == 10
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect(validate_stream(T, [], batch_size=0)))
@@ -37,3 +37,36 @@ def test_bool():
 
     with pytest.raises(TypeError):
         T(flag=False, flag_=False).flag_op = "false"
+
+
+def test_bool_packed():
+    """Test packed bool fields.
+
+    GIVEN a dataclass with packed `bool` fields
+    WHEN values are set
+    THEN they should be stored in a single int.
+    """
+    @dataclass
+    class T:
+        a: bool = BoolField(packed=True)
+        b: bool = BoolField(packed=True)
+        c: Optional[bool] = BoolField(packed=True, optional=True)
+        d: bool = BoolField(packed=True, default=True)
+
+    t = T(a=True, b=False)
+
+    assert t.a is True
+    assert t.b is False
+    assert t.c is None
+    assert t.d is True
+    assert list(t.__dict__) == ["_dcv_packed"]
+
+    t.b = True
+    t.a = False
+    t.c = False
+    assert (t.a, t.b, t.c, t.d) == (False, True, False, True)
+    assert T(a=False, b=True, c=False).__dict__ == t.__dict__
+
+    with pytest.raises(TypeError):
+        t.a = "true"
+    assert t.a is False
@@ -0,0 +1,201 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from decimal import Decimal
+import pytest
+from dcv import cross_field
+from dcv.cache import ValidationCache, record_key, schema_fingerprint, validate_many
+from dcv.fields import DecimalField, IntField, TextField
+
+
+class CountingTextField(TextField):
+    """Text field counting validations."""
+    calls = 0
+
+    def validate(self, value):
+        CountingTextField.calls += 1
+        super().validate(value)
+
+
+def make_class(max_length):
+    @dataclass
+    class T:
+        name: str = CountingTextField(max_length=max_length)
+        qty: int = IntField(ge=0)
+
+    return T
+
+
+def test_lazy_import():
+    """Lazy import.
+
+    GIVEN the `dcv` package
+    WHEN it is imported
+    THEN the cache should only be imported when one of its names is used
+    """
+    code = (
+        "import sys, dcv\n"
+        "assert 'sqlite3' not in sys.modules and 'dcv.cache' not in sys.modules\n"
+        "assert dcv.ValidationCache is sys.modules['dcv.cache'].ValidationCache\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_validate_many_cache(tmp_path):
+    """Validate records with a cache.
+
+    GIVEN a persistent validation cache
+    WHEN records are validated in several runs
+    THEN records known to be valid and duplicates should only be validated once
+    """
+    T = make_class(5)
+    records = [{"name": "a", "qty": 1}, {"qty": 1, "name": "a"}, {"name": "b", "qty": -1}]
+    path = tmp_path / "cache.sqlite3"
+
+    calls = CountingTextField.calls
+    with ValidationCache(path) as cache:
+        errors = validate_many(T, records, cache=cache)
+    assert [error.index for error in errors] == [2]
+    assert CountingTextField.calls == calls + 2
+
+    calls = CountingTextField.calls
+    with ValidationCache(path) as cache:
+        assert record_key(T, records[0]) in cache
+        errors = validate_many(T, records, cache=cache)
+    assert [error.index for error in errors] == [2]
+    assert CountingTextField.calls == calls + 1
+
+    calls = CountingTextField.calls
+    with ValidationCache(path) as cache:
+        assert validate_many(make_class(3), records[:2], cache=cache) == []
+        assert record_key(T, records[0], coerce=True) not in cache
+    assert CountingTextField.calls == calls + 1
+
+
+def test_record_key_types():
+    """Record keys of values with different types.
+
+    GIVEN records with equal representations but values of different types
+    WHEN they are validated with a cache
+    THEN their keys should be different and invalid records should not be found in the cache
+    """
+    @dataclass
+    class P:
+        price: Decimal = DecimalField()
+
+    valid = {"price": Decimal("1.50")}
+    invalid = {"price": "decimal.Decimal:Decimal('1.50')"}
+    assert record_key(P, valid) != record_key(P, invalid)
+    assert record_key(P, {"price": (1, 2)}) != record_key(P, {"price": [1, 2]})
+    assert record_key(P, {"price": 1}) != record_key(P, {"price": True})
+    assert record_key(P, {"price": "1"}) != record_key(P, {"price": 1})
+    assert record_key(P, {"a": 1, "price": 2}) == record_key(P, {"price": 2, "a": 1})
+
+    with ValidationCache() as cache:
+        assert validate_many(P, [valid], cache=cache) == []
+        errors = validate_many(P, [invalid], cache=cache)
+    assert [error.index for error in errors] == [0]
+
+
+def test_schema_fingerprint():
+    """Schema fingerprint.
+
+    GIVEN dataclasses using dcv fields
+    WHEN their fingerprints are computed
+    THEN they should only be equal if their fields have the same constraints
+    """
+    assert schema_fingerprint(make_class(5)) == schema_fingerprint(make_class(5))
+    assert schema_fingerprint(make_class(5)) != schema_fingerprint(make_class(6))
+
+    @dataclass
+    class P:
+        price: Decimal = DecimalField(default_factory=lambda: Decimal("1"))
+
+    fingerprint = schema_fingerprint(P)
+
+    @dataclass
+    class P:
+        price: Decimal = DecimalField(default_factory=lambda: Decimal("2"))
+
+    assert schema_fingerprint(P) != fingerprint
+
+    assert record_key(P, {"price": object()}) is None
+    with pytest.raises(TypeError):
+        schema_fingerprint(dict)
+
+
+def make_range(validate):
+    @dataclass
+    class Range:
+        min_qty: int = IntField()
+        max_qty: int = IntField()
+
+        check = cross_field("min_qty", "max_qty")(validate)
+
+    return Range
+
+
+def test_schema_fingerprint_code():
+    """Schema fingerprint of code.
+
+    GIVEN dataclasses which only differ in the names used by their validation code
+    WHEN their fingerprints are computed
+    THEN they should be different
+    """
+    def check(self):
+        if self.min_qty > self.max_qty:
+            raise ValueError("invalid range")
+
+    fingerprint = schema_fingerprint(make_range(check))
+    assert schema_fingerprint(make_range(check)) == fingerprint
+
+    def check(self):
+        if self.max_qty > self.min_qty:
+            raise ValueError("invalid range")
+
+    assert schema_fingerprint(make_range(check)) != fingerprint
+
+    def make_text(normalize):
+        class NormalizedTextField(TextField):
+            def transform(self, value):
+                return self._normalize(super().transform(value))
+
+            _normalize = staticmethod(normalize)
+
+        @dataclass
+        class Text:
+            name: str = NormalizedTextField()
+
+        return Text
+
+    assert schema_fingerprint(make_text(str.lower)) == schema_fingerprint(make_text(str.lower))
+    assert (
+        schema_fingerprint(make_text(lambda value: value.lower())) !=
+        schema_fingerprint(make_text(lambda value: value.upper()))
+    )
+
+
+def test_schema_fingerprint_class_constants():
+    """Schema fingerprint of field class constants.
+
+    GIVEN dataclasses using field classes which only differ in a class constant
+    WHEN their fingerprints are computed
+    THEN they should be different
+    """
+    def make_class(maximum):
+        class ShortTextField(TextField):
+            MAX = maximum
+
+            def validate(self, value):
+                super().validate(value)
+                if len(value) > self.MAX:
+                    raise ValueError("too long")
+
+        @dataclass
+        class T:
+            name: str = ShortTextField()
+
+        return T
+
+    assert schema_fingerprint(make_class(3)) == schema_fingerprint(make_class(3))
+    assert schema_fingerprint(make_class(3)) != schema_fingerprint(make_class(5))
@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+import pytest
+from dcv.fields import ComputedField, DecimalField, IntField, TextField
+
+
+def test_computed():
+    """Test computed field.
+
+    GIVEN a dataclass with a computed field depending on other fields
+    WHEN the computed field is read
+    THEN it should be computed once and computed again after a dependency is set.
+    """
+    calls = []
+
+    def compute_total(obj):
+        calls.append(1)
+        return obj.price * obj.quantity
+
+    @dataclass
+    class T:
+        price: Decimal = DecimalField(places=2)
+        quantity: int = IntField(fast_read=True)
+        name: str = field(default=TextField())
+        total = ComputedField(compute_total, depends_on=["price", "quantity"])
+        key = ComputedField(lambda obj: obj.name.lower(), depends_on=["name"])
+
+    t = T(price=Decimal("2.50"), quantity=2, name="Item")
+
+    assert t.total == Decimal("5.00")
+    assert t.total == Decimal("5.00")
+    assert len(calls) == 1
+
+    t.name = "Other"
+    assert t.total == Decimal("5.00")
+    assert len(calls) == 1
+    assert t.key == "other"
+
+    t.quantity = 3
+    assert t.total == Decimal("7.50")
+    t.price = Decimal("1.00")
+    assert t.total == Decimal("3.00")
+    assert len(calls) == 3
+
+    with pytest.raises(TypeError):
+        t.quantity = 1.5
+    assert t.total == Decimal("3.00")
+
+    assert T(price=Decimal("1.00"), quantity=1, name="Item").total == Decimal("1.00")
+
+
+def test_computed_chained():
+    """Test computed field.
+
+    GIVEN a computed field depending on another computed field
+    WHEN a field the other computed field depends on is set
+    THEN both values should be computed again.
+    """
+    @dataclass
+    class T:
+        first: str = TextField()
+        last: str = TextField()
+        full = ComputedField(lambda obj: f"{obj.first} {obj.last}", depends_on=["first", "last"])
+        upper = ComputedField(lambda obj: obj.full.upper(), depends_on=["full"])
+
+    t = T(first="Ada", last="Lovelace")
+
+    assert t.upper == "ADA LOVELACE"
+    t.last = "Byron"
+    assert t.full == "Ada Byron"
+    assert t.upper == "ADA BYRON"
+
+
+def test_computed_invalid_dependency():
+    """Test computed field.
+
+    GIVEN a computed field
+    WHEN it depends on an attribute which is not a field or on itself
+    THEN a TypeError should be raised when the class is created.
+    """
+    with pytest.raises(RuntimeError):
+        @dataclass
+        class T:
+            name: str = TextField()
+            key = ComputedField(lambda obj: obj.name, depends_on=["other"])
+
+    with pytest.raises(RuntimeError):
+        @dataclass
+        class C:
+            a = ComputedField(lambda obj: obj.b, depends_on=["b"])
+            b = ComputedField(lambda obj: obj.a, depends_on=["a"])
+
+
+def test_computed_inheritance():
+    """Test computed field.
+
+    GIVEN a subclass adding a computed field depending on a field of its base
+    WHEN the field is set on instances of the base and the subclass
+    THEN only the subclass instances should remove the stored value.
+    """
+    @dataclass
+    class Base:
+        name: str = TextField()
+
+        def __post_init__(self):
+            self.label = "base"
+
+    @dataclass
+    class Child(Base):
+        label = ComputedField(lambda obj: obj.name.upper(), depends_on=["name"])
+
+        def __post_init__(self):
+            pass
+
+    base = Base(name="a")
+    base.name = "b"
+    assert base.label == "base"
+
+    child = Child(name="a")
+    assert child.label == "A"
+    child.name = "b"
+    assert child.label == "B"
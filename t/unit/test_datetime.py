@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from datetime import date, datetime, timedelta, date, time
+from datetime import date, datetime, timedelta, date, time, timezone
 from typing import Union
 import pytest
 from dcv.fields import (
@@ -339,3 +339,133 @@ def test_datetime_le():
             date_val=valid_da,
             time_val=invalid_ti
         )
+
+
+def test_datetime_parse():
+    """Test parsing of strings and epoch numbers
+
+    GIVEN a dataclass with date time fields with `parse` set
+    WHEN ISO 8601 strings or epoch numbers are set
+    THEN values should be converted before validation
+    """
+    @dataclass
+    class T:
+        date_time: datetime = DateTimeField(parse=True, gt=datetime(2021, 1, 1, tzinfo=timezone.utc))
+        time_delta: timedelta = TimeDeltaField(parse=True)
+        date_val: date = DateField(parse=True)
+        time_val: time = TimeField(parse=True)
+
+    t = T(
+        date_time="2021-02-02T10:00:00Z",
+        time_delta=90,
+        date_val="2021-02-02",
+        time_val="10:30"
+    )
+    assert t.date_time == datetime(2021, 2, 2, 10, tzinfo=timezone.utc)
+    assert t.time_delta == timedelta(seconds=90)
+    assert t.date_val == date(2021, 2, 2)
+    assert t.time_val == time(10, 30)
+
+    t.date_time = 1612260000
+    assert t.date_time == datetime(2021, 2, 2, 10, tzinfo=timezone.utc)
+    t.date_val = 1612260000
+    assert t.date_val == date(2021, 2, 2)
+
+    with pytest.raises(ValueError):
+        t.date_time = "2020-01-01T00:00:00+00:00"
+
+    with pytest.raises(TypeError):
+        t.date_time = "not a date"
+
+    with pytest.raises(TypeError):
+        t.time_val = 10
+
+
+def test_datetime_tz():
+    """Test timezone normalization
+
+    GIVEN a dataclass with a date time field with `tz` set
+    WHEN naive or aware datetimes are set
+    THEN values should be normalized to the timezone
+    """
+    tz = timezone(timedelta(hours=-6))
+
+    @dataclass
+    class T:
+        date_time: datetime = DateTimeField(tz=tz)
+
+    t = T(date_time=datetime(2021, 1, 1, 12, tzinfo=timezone.utc))
+    assert t.date_time.tzinfo is tz
+    assert t.date_time.hour == 6
+
+    t.date_time = datetime(2021, 1, 1, 12)
+    assert t.date_time == datetime(2021, 1, 1, 12, tzinfo=tz)
+
+
+def test_datetime_store_as_int():
+    """Test int storage
+
+    GIVEN a dataclass with date time fields with `store_as_int` set
+    WHEN values are set
+    THEN they should be stored as microseconds and materialized on read
+    """
+    tz = timezone(timedelta(hours=2))
+
+    @dataclass
+    class T:
+        date_time: datetime = DateTimeField(store_as_int=True, ge=datetime(2021, 1, 1))
+        time_delta: timedelta = TimeDeltaField(store_as_int=True, lt=timedelta(days=1))
+        aware: datetime = DateTimeField(store_as_int=True, tz=tz, gt=datetime(2021, 1, 1))
+
+    value = datetime(2021, 2, 2, 10, 30, 15, 20)
+    t = T(
+        date_time=value,
+        time_delta=timedelta(hours=1),
+        aware=datetime(2021, 2, 2, tzinfo=timezone.utc)
+    )
+
+    assert t.date_time == value
+    assert t.__dict__["date_time"] == (value - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+    assert t.time_delta == timedelta(hours=1)
+    assert t.__dict__["time_delta"] == 3600 * 10 ** 6
+    assert t.aware == datetime(2021, 2, 2, 2, tzinfo=tz)
+    assert t.aware.tzinfo is tz
+
+    with pytest.raises(ValueError):
+        t.date_time = datetime(2020, 12, 31)
+
+    with pytest.raises(ValueError):
+        t.time_delta = timedelta(days=2)
+
+    with pytest.raises(ValueError):
+        t.aware = datetime(2020, 12, 31, 23, tzinfo=tz)
+
+    with pytest.raises(ValueError):
+        t.date_time = datetime(2021, 2, 2, tzinfo=timezone.utc)
+
+    with pytest.raises(TypeError):
+        DateField(store_as_int=True)
+
+
+def test_datetime_store_as_int_parse():
+    """Test int storage of parsed values
+
+    GIVEN a dataclass with a parsed `datetime` field stored as int without `tz`
+    WHEN epoch numbers and ISO 8601 strings with an offset are set
+    THEN they should be stored and materialized as naive UTC values
+    """
+    @dataclass
+    class T:
+        date_time: datetime = DateTimeField(store_as_int=True, parse=True, ge=datetime(2021, 1, 1))
+
+    expected = datetime(2021, 2, 2, 10, 30)
+    for value in (expected.replace(tzinfo=timezone.utc).timestamp(), "2021-02-02T10:30:00Z",
+                  "2021-02-02T12:30:00+02:00", "2021-02-02T10:30:00"):
+        t = T(date_time=value)
+        assert t.date_time == expected
+        assert t.date_time.tzinfo is None
+
+    assert T(date_time=int(expected.replace(tzinfo=timezone.utc).timestamp())).date_time == expected
+
+    with pytest.raises(ValueError):
+        T(date_time="2020-12-31T23:00:00Z")
@@ -0,0 +1,103 @@
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from enum import Enum
+from io import StringIO
+from typing import Optional, List
+import json
+import pytest
+from dcv import dumps, dump
+from dcv.fields import (
+    TextField, IntField, FloatField, DecimalField,
+    BoolField, EnumField, DateTimeField, DateField, TimeDeltaField
+)
+
+
+class Size(Enum):
+    S = 'small'
+    L = 'large'
+
+
+@dataclass
+class Item:
+    name: str = TextField()
+    qty: int = IntField()
+    price: Decimal = DecimalField()
+    size: Size = EnumField()
+    available: bool = BoolField()
+    created: datetime = DateTimeField()
+    weight: Optional[float] = FloatField(optional=True)
+    tags: List[str] = field(default_factory=list)
+
+
+def make_item(**kwargs):
+    values = dict(
+        name="shirt",
+        qty=2,
+        price=Decimal("10.50"),
+        size=Size.L,
+        available=True,
+        created=datetime(2021, 1, 1, 12, 30),
+        tags=["a", "b"],
+    )
+    values.update(kwargs)
+    return Item(**values)
+
+
+def test_dumps():
+    """Serialize a dataclass.
+
+    GIVEN a dataclass with dcv fields
+    WHEN it is serialized
+    THEN the output should match encoding the equivalent dict
+    """
+    item = make_item()
+    expected = asdict(item)
+    expected.update(
+        price="10.50",
+        size="large",
+        created="2021-01-01T12:30:00",
+    )
+
+    assert dumps(item) == json.dumps(expected)
+    assert json.loads(dumps(item))["weight"] is None
+
+
+def test_dumps_nested_and_lists():
+    """Serialize nested values.
+
+    GIVEN a list of dataclasses, some nested in other dataclasses
+    WHEN they are serialized
+    THEN every value should be encoded
+    """
+    @dataclass
+    class Order:
+        day: date = DateField()
+        wait: timedelta = TimeDeltaField()
+        items: List[Item] = field(default_factory=list)
+
+    order = Order(day=date(2021, 1, 2), wait=timedelta(minutes=1), items=[make_item()])
+    result = json.loads(dumps([order, order]))
+
+    assert len(result) == 2
+    assert result[0]["day"] == "2021-01-02"
+    assert result[0]["wait"] == 60.0
+    assert result[0]["items"][0]["name"] == "shirt"
+    assert dumps([]) == "[]"
+
+    with pytest.raises(TypeError):
+        dumps(object())
+
+
+def test_dump_stream():
+    """Serialize to a stream.
+
+    GIVEN a generator of dataclasses
+    WHEN it is written to a stream
+    THEN the output should be a JSON array
+    """
+    stream = StringIO()
+    dump((make_item(qty=qty) for qty in range(1000)), stream)
+    result = json.loads(stream.getvalue())
+
+    assert [item["qty"] for item in result] == list(range(1000))
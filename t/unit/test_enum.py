@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional, Any
+from enum import Enum, IntEnum
+from typing import Optional, Any, Union
 import pytest
 from dcv.fields import EnumField
 
@@ -58,3 +58,89 @@ def test_enums():
             size_field=Size.XL,
             optional_size=NotASize.XS,
         )
+
+
+def test_enums_packed():
+    """Test packed enum fields.
+
+    GIVEN a dataclass with packed `Enum` fields
+    WHEN valid enum values are given
+    THEN they should be stored as ordinals in a single int.
+    """
+    @dataclass
+    class T:
+        size: Size = EnumField(packed=True)
+        optional_size: Optional[Size] = EnumField(packed=True, optional=True)
+
+    t = T(size=Size.XL)
+
+    assert t.size is Size.XL
+    assert t.optional_size is None
+    assert list(t.__dict__) == ["_dcv_packed"]
+
+    for size in Size:
+        t.optional_size = size
+        assert t.optional_size is size
+        assert t.size is Size.XL
+
+    with pytest.raises(TypeError):
+        t.size = "small"
+
+    with pytest.raises(RuntimeError):
+        @dataclass
+        class Generic:
+            enumeration: Enum = EnumField(packed=True)
+
+    with pytest.raises(RuntimeError):
+        @dataclass
+        class PartlyGeneric:
+            enumeration: Union[Size, Enum] = EnumField(packed=True)
+
+
+def test_enums_packed_union():
+    """Test packed enum fields with a `Union` type hint.
+
+    GIVEN a dataclass with a packed field using several `Enum` classes
+    WHEN members of any of them are given, including equal `IntEnum` members
+    THEN they should be stored and read back.
+    """
+    class Low(IntEnum):
+        ONE = 1
+        TWO = 2
+
+    class High(IntEnum):
+        TWO = 2
+        THREE = 3
+
+    @dataclass
+    class T:
+        value: Optional[Union[Size, Low, High]] = EnumField(packed=True, optional=True)
+
+    t = T()
+    for member in (*Size, *Low, *High, None):
+        t.value = member
+        assert t.value is member
+
+
+def test_enums_choices():
+    """Test enum choices.
+
+    GIVEN a dataclass with `Enum` fields with choices
+    WHEN a value is given
+    THEN only the choices should be valid.
+    """
+    @dataclass
+    class T:
+        size: Size = EnumField(choices=[Size.S, "medium"])
+        other: Size = EnumField(case_sensitive=False)
+
+    t = T(size=Size.S, other=Size.XL)
+    t.size = Size.M
+
+    with pytest.raises(ValueError):
+        t.size = Size.L
+
+    field = vars(T)["size"]
+    assert field.coerce("small") is Size.S
+    assert field.coerce("large") == "large"
+    assert vars(T)["other"].coerce("X-Large") is Size.XL
@@ -3,7 +3,10 @@ import pytest
 from typing import Optional, cast, List
 from inspect import signature
 from dcv.fields import Field
+from dcv.fields import abstract
+from dcv.fields.abstract import FastReadField
 import types
+import typing
 
 class MyField(Field):
     """Custom field."""
@@ -160,3 +163,124 @@ def test_field_with_wrong_typehint():
         name: S = MyField()
 
     assert isinstance(vars(T)['name'], MyField)
+
+
+def test_field_fast_read():
+    """Base field.
+
+    GIVEN a custom field with `fast_read` set
+    WHEN a dataclass uses it
+    THEN values should be validated on write and read from the instance directly.
+    """
+    @dataclass
+    class T:
+        name: str = MyField(fast_read=True)
+        optional_name: Optional[str] = MyField(optional=True, fast_read=True)
+        default_name: str = field(default=MyField(default="x", fast_read=True))
+
+    assert isinstance(vars(T)["name"], FastReadField)
+    assert not hasattr(FastReadField, "__set__")
+
+    t = T(name="x")
+    assert t.name == "x"
+    assert t.optional_name is None
+    assert t.default_name == "x"
+    assert t.__dict__ == {"name": "x", "optional_name": None, "default_name": "x"}
+
+    with pytest.raises(AssertionError):
+        t.name = "invalid string"
+
+    with pytest.raises(TypeError):
+        T()
+
+    unset = T.__new__(T)
+    with pytest.raises(AttributeError):
+        unset.name
+    assert not hasattr(unset, "name")
+    assert unset.optional_name is None
+    assert unset.default_name == "x"
+
+    unset.name = "x"
+    assert unset.name == "x"
+    with pytest.raises(AssertionError):
+        unset.name = "invalid string"
+
+    with pytest.raises(RuntimeError):
+        @dataclass
+        class P:
+            name: str = MyField(use_private_attr=True, fast_read=True)
+
+    with pytest.raises(RuntimeError):
+        @dataclass
+        class N:
+            name: str = field(default=MyField(default="x", fast_read=True), init=False)
+
+
+def test_field_default_factory():
+    """Base field.
+
+    GIVEN a custom field with a `default_factory`
+    WHEN a dataclass uses it
+    THEN the factory should only run when the value is first read without being set.
+    """
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "x"
+
+    @dataclass
+    class T:
+        name: str = MyField(default_factory=factory)
+        eager: str = MyField(default_factory=factory, fast_read=True)
+
+    t = T()
+    assert len(calls) == 1
+    assert t.__dict__ == {"eager": "x"}
+
+    assert t.name == "x"
+    assert t.name == "x"
+    assert len(calls) == 2
+    assert t.__dict__ == {"eager": "x", "name": "x"}
+
+    assert T(name="x", eager="x").name == "x"
+    assert len(calls) == 2
+
+    def invalid():
+        return "invalid string"
+
+    @dataclass
+    class I:
+        name: str = MyField(default_factory=invalid)
+
+    i = I()
+    with pytest.raises(AssertionError):
+        i.name
+
+    with pytest.raises(ValueError):
+        MyField(default="x", default_factory=factory)
+
+
+def test_field_type_hints_resolved_once(monkeypatch):
+    """Base field.
+
+    GIVEN a class with several custom fields
+    WHEN the class is created
+    THEN type hints should be resolved once for the class and not for every field.
+    """
+    calls = []
+
+    def get_type_hints(owner):
+        calls.append(owner)
+        return typing.get_type_hints(owner)
+
+    monkeypatch.setattr(abstract, "get_type_hints", get_type_hints)
+
+    @dataclass
+    class T:
+        name: str = MyField()
+        other: Optional[str] = MyField(optional=True)
+        last: str = MyField(default="x")
+
+    assert calls == [T]
+    assert T.__dict__["other"]._valid_classes == (str, type(None))
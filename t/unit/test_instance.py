@@ -0,0 +1,172 @@
+from copy import copy, deepcopy
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+import pickle
+import pytest
+from dcv import cross_field, fast_copy, replace, track_changes, changed_fields, changes, mark_clean
+from dcv.fields import TextField, DecimalField, BoolField, DateTimeField, IntField, ComputedField
+
+
+class CountingTextField(TextField):
+    """Text field counting validations."""
+    calls = 0
+
+    def validate(self, value):
+        CountingTextField.calls += 1
+        super().validate(value)
+
+
+@fast_copy
+@dataclass
+class T:
+    name: str = CountingTextField(use_private_attr=True)
+    amount: Decimal = DecimalField(places=2)
+    flag: bool = BoolField(packed=True)
+    created: datetime = DateTimeField(store_as_int=True)
+    tags: List[str] = field(default_factory=list)
+
+
+def make():
+    return T(
+        name="x",
+        amount=Decimal("1.50"),
+        flag=True,
+        created=datetime(2021, 1, 1),
+        tags=["a"]
+    )
+
+
+def test_pickle():
+    """Pickle instances.
+
+    GIVEN a dataclass decorated with `fast_copy`
+    WHEN an instance is pickled and unpickled
+    THEN stored values should be transferred without validating them again
+    """
+    t = make()
+    calls = CountingTextField.calls
+    result = pickle.loads(pickle.dumps(t))
+
+    assert CountingTextField.calls == calls
+    assert result == t
+    assert result.__dict__ == t.__dict__
+    assert "name" not in result.__dict__
+
+
+def test_copy():
+    """Copy instances.
+
+    GIVEN a dataclass decorated with `fast_copy`
+    WHEN an instance is copied
+    THEN stored values should be transferred without validating them again
+    """
+    t = make()
+    calls = CountingTextField.calls
+    shallow = copy(t)
+    deep = deepcopy(t)
+
+    assert CountingTextField.calls == calls
+    assert shallow == t == deep
+    assert shallow.tags is t.tags
+    assert deep.tags is not t.tags
+    assert deep.__dict__["_name"] is t.__dict__["_name"]
+
+    deep.flag = False
+    assert t.flag is True
+
+
+@fast_copy
+@track_changes
+@dataclass
+class Tracked:
+    name: str = TextField()
+    amount: Decimal = DecimalField(places=2)
+    count: int = IntField(fast_read=True)
+
+    def __post_init__(self):
+        self.count += 1
+
+
+def test_track_changes():
+    """Track changes.
+
+    GIVEN a dataclass decorated with `track_changes`
+    WHEN fields are set after the instance is created
+    THEN the fields set should be recorded until the instance is marked clean
+    """
+    t = Tracked(name="x", amount=Decimal("1.00"), count=1)
+    assert changed_fields(t) == ()
+
+    t.amount = Decimal("2.50")
+    t.name = "y"
+    t.amount = Decimal("3.00")
+    t.count = 5
+    assert changed_fields(t) == ("amount", "name", "count")
+    assert changes(t) == {"amount": Decimal("3.00"), "name": "y", "count": 5}
+
+    with pytest.raises(ValueError):
+        t.name = ""
+
+    mark_clean(t)
+    assert changed_fields(t) == ()
+
+    t.name = "z"
+    c = copy(t)
+    c.count = 1
+    assert changed_fields(t) == ("name",)
+    assert changed_fields(c) == ("name", "count")
+
+    with pytest.raises(TypeError):
+        changed_fields(make())
+
+
+@dataclass
+class Range:
+    name: str = CountingTextField()
+    start: int = IntField()
+    end: int = IntField()
+    size = ComputedField(lambda obj: obj.end - obj.start, depends_on=["start", "end"])
+    tags: List[str] = field(default_factory=list)
+
+    @cross_field("start", "end")
+    def check_order(self):
+        if self.start >= self.end:
+            raise ValueError("'start' must be less than 'end'.")
+
+
+def test_replace():
+    """Replace values.
+
+    GIVEN an instance of a dataclass using `dcv` fields
+    WHEN `replace` is used
+    THEN only the values given should be validated, after all of them are set
+    """
+    r = Range(name="r", start=1, end=5)
+    assert r.size == 4
+    calls = CountingTextField.calls
+
+    moved = replace(r, start=10, end=20)
+    assert CountingTextField.calls == calls
+    assert (moved.name, moved.start, moved.end, moved.size) == ("r", 10, 20, 10)
+    assert (r.start, r.end, r.size) == (1, 5, 4)
+
+    tagged = replace(r, tags=["a"], name="t")
+    assert CountingTextField.calls == calls + 1
+    assert tagged.tags == ["a"]
+    assert tagged.name == "t"
+
+    with pytest.raises(ValueError):
+        replace(r, start=5)
+
+    with pytest.raises(TypeError):
+        replace(r, start="5")
+
+    with pytest.raises(TypeError):
+        replace(r, other=1)
+
+    t = Tracked(name="x", amount=Decimal("1.00"), count=1)
+    t.name = "y"
+    assert changed_fields(replace(t, amount=Decimal("2.00"))) == ()
+    assert changed_fields(t) == ("name",)
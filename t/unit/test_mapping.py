@@ -0,0 +1,180 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional, Union
+import pytest
+from dcv import cross_field, from_dict, validate_mapping
+from dcv.exceptions import ValidationError
+from dcv.fields import (
+    TextField, NumberField, IntField, FloatField, DecimalField, BoolField, ComputedField
+)
+
+
+@dataclass
+class T:
+    name: str = TextField()
+    qty: int = IntField(ge=0)
+    ratio: float = FloatField()
+    price: Decimal = DecimalField()
+    active: bool = BoolField()
+    amount: Optional[Union[int, float]] = NumberField(optional=True)
+    note: str = field(default=TextField(default="-"), init=False)
+    rate: float = NumberField(default=1.0)
+    total: Union[Decimal, complex] = NumberField(default=Decimal("0"))
+
+
+DATA = {
+    "name": "x",
+    "qty": "10",
+    "ratio": "0.5",
+    "price": "1.10",
+    "active": "True",
+    "amount": "3",
+    "note": "n",
+    "unknown": "ignored",
+}
+
+
+def test_from_dict():
+    """Build from mapping.
+
+    GIVEN a dataclass with dcv fields
+    WHEN it is built from a mapping with valid values
+    THEN every field should be set, including non-init fields
+    """
+    t = from_dict(T, dict(DATA, qty=10, ratio=0.5, price=Decimal("1.10"), active=True, amount=3))
+
+    assert t.qty == 10
+    assert t.note == "n"
+
+    with pytest.raises(TypeError):
+        from_dict(T, DATA)
+
+
+def test_from_dict_coerce():
+    """Build from mapping with coercion.
+
+    GIVEN a dataclass with dcv fields
+    WHEN it is built from a mapping of strings with `coerce=True`
+    THEN values should be converted before validation
+    """
+    t = from_dict(T, DATA, coerce=True)
+
+    assert t.name == "x"
+    assert t.qty == 10
+    assert t.ratio == 0.5
+    assert t.price == Decimal("1.10")
+    assert t.active is True
+    assert t.amount == 3
+
+    t = from_dict(T, dict(DATA, amount="3.5", rate="1", total="2.50"), coerce=True)
+    assert t.amount == 3.5
+    assert type(t.rate) is float and t.rate == 1.0
+    assert t.total == Decimal("2.50")
+    assert from_dict(T, dict(DATA, total="1+2j"), coerce=True).total == 1 + 2j
+
+    assert from_dict(T, dict(DATA, active="off"), coerce=True).active is False
+
+    with pytest.raises(ValueError):
+        from_dict(T, dict(DATA, qty="-1"), coerce=True)
+
+    with pytest.raises(TypeError):
+        from_dict(T, dict(DATA, qty="ten"), coerce=True)
+
+    with pytest.raises(TypeError):
+        from_dict(T, dict(DATA, active="maybe"), coerce=True)
+
+
+@dataclass
+class Order:
+    name: str = TextField(trim=True)
+    min_qty: int = IntField(ge=0)
+    max_qty: int = IntField(default=100)
+    tags: list = field(default_factory=list)
+
+    @cross_field("min_qty", "max_qty")
+    def check_quantities(self):
+        if self.min_qty > self.max_qty:
+            raise ValueError("'min_qty' cannot be more than 'max_qty'.")
+
+
+def test_validate_mapping():
+    """Validate mapping.
+
+    GIVEN a dataclass with dcv fields and a cross-field validator
+    WHEN a mapping is validated
+    THEN transformed values should be returned or every error raised
+    """
+    data = {"name": " x ", "min_qty": "5", "unknown": 1}
+
+    assert validate_mapping(Order, data, coerce=True) == {"name": "x", "min_qty": 5}
+    assert validate_mapping(Order, {"name": "x", "min_qty": 1, "tags": ["a"]}) == {
+        "name": "x", "min_qty": 1, "tags": ["a"]
+    }
+
+    with pytest.raises(ValidationError) as error:
+        validate_mapping(Order, {"min_qty": -1})
+    assert set(error.value.errors) == {"name", "min_qty"}
+    assert isinstance(error.value.errors["name"], TypeError)
+    assert isinstance(error.value.errors["min_qty"], ValueError)
+
+    with pytest.raises(ValueError) as error:
+        validate_mapping(Order, {"name": "x", "min_qty": 200})
+    assert set(error.value.errors) == {"check_quantities"}
+
+    with pytest.raises(ValidationError) as error:
+        validate_mapping(Order, {"name": "x", "min_qty": 200, "max_qty": "a"})
+    assert set(error.value.errors) == {"max_qty"}
+
+
+@dataclass
+class Box:
+    width: int = IntField(ge=0)
+    height: int = IntField(ge=0)
+    area = ComputedField(lambda obj: obj.width * obj.height, depends_on=["width", "height"])
+
+    @property
+    def limit(self):
+        return 100
+
+    @cross_field("width", "height")
+    def check_area(self):
+        if self.area > self.limit:
+            raise ValueError("'area' cannot be more than 100.")
+
+    @cross_field("width")
+    def check_width(self):
+        if self.width == 7:
+            raise LookupError("7 is not allowed.")
+
+
+def test_validate_mapping_uses_class(monkeypatch):
+    """Validate mapping with validators using the class.
+
+    GIVEN a dataclass with validators using a computed field, a property and any exception
+    WHEN a mapping is validated
+    THEN validators should run without an instance of the class and every exception be an error
+    """
+    def new(cls, *args, **kwargs):
+        raise AssertionError("instance created")
+
+    gets = []
+    get = IntField.__get__
+
+    def counting_get(self, obj, objtype=None):
+        gets.append(obj)
+        return get(self, obj, objtype)
+
+    monkeypatch.setattr(Box, "__new__", new)
+    monkeypatch.setattr(IntField, "__get__", counting_get)
+
+    assert validate_mapping(Box, {"width": 5, "height": 20}) == {"width": 5, "height": 20}
+
+    with pytest.raises(ValidationError) as error:
+        validate_mapping(Box, {"width": 20, "height": 20})
+    assert set(error.value.errors) == {"check_area"}
+
+    with pytest.raises(ValidationError) as error:
+        validate_mapping(Box, {"width": 7, "height": 1})
+    assert set(error.value.errors) == {"check_width"}
+    assert isinstance(error.value.errors["check_width"], LookupError)
+    assert all(obj is None for obj in gets)
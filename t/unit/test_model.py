@@ -0,0 +1,71 @@
+from dataclasses import fields, is_dataclass
+from typing import Optional
+import pytest
+from dcv import build_model, from_dict
+from dcv.fields import IntField, TextField
+from dcv import model
+
+
+def make_spec(max_length=20):
+    return {
+        "name": {"field": "TextField", "max_length": max_length, "choices": ["a", "b"]},
+        "qty": {"field": IntField, "ge": 0, "default": 1},
+        "note": {"field": "TextField", "type": Optional[str], "optional": True},
+    }
+
+
+def test_build_model():
+    """Build model.
+
+    GIVEN a declarative spec of dcv fields
+    WHEN a model is built from it
+    THEN a dataclass validating the fields should be returned
+    """
+    Item = build_model("Item", make_spec())
+
+    assert is_dataclass(Item)
+    assert Item.__name__ == "Item"
+    assert [f.name for f in fields(Item)] == ["name", "qty", "note"]
+
+    item = Item(name="a")
+    assert item.qty == 1
+    assert item.note is None
+    assert from_dict(Item, {"name": "b", "qty": 3}).qty == 3
+
+    with pytest.raises(ValueError):
+        Item(name="c")
+
+    with pytest.raises(ValueError):
+        item.qty = -1
+
+    with pytest.raises(TypeError):
+        Item("a")
+
+    with pytest.raises(TypeError):
+        build_model("Bad", {"name": {"field": "UnknownField"}})
+
+    with pytest.raises(TypeError):
+        build_model("Bad", {"name": {"max_length": 1}})
+
+
+def test_build_model_cache(monkeypatch):
+    """Build model cache.
+
+    GIVEN specs built several times
+    WHEN models are built from them
+    THEN equal specs should return the same class until it is evicted
+    """
+    model.clear_models()
+    monkeypatch.setattr(model, "MODEL_CACHE_SIZE", 2)
+
+    Item = build_model("Item", make_spec())
+    assert build_model("Item", make_spec()) is Item
+    assert build_model("Item", make_spec(max_length=20.0)) is not Item
+    assert build_model("Other", make_spec()) is not Item
+
+    build_model("Item", make_spec(10))
+    build_model("Item", make_spec(11))
+    assert build_model("Item", make_spec()) is not Item
+
+    unhashable = {"name": {"field": TextField, "trim": bytearray(b" ")}}
+    assert build_model("Item", unhashable) is not build_model("Item", unhashable)
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Union
 import pytest
-from dcv.fields import NumberField, ComplexField
+from dcv.fields import NumberField, ComplexField, DecimalField, IntField
 
 def test_numbers():
     """Test all number types.
@@ -224,3 +224,144 @@ def test_le():
 
     with pytest.raises(ValueError):
         TDecimal(second_num=Decimal(3.0), num=3.1)
+
+
+def test_decimal_places():
+    """Test decimal places and max digits.
+
+    GIVEN a dataclass with a `Decimal` field with `places` and `max_digits`
+    WHEN a value is given
+    THEN it should be validated and stored as a scaled int.
+    """
+    @dataclass
+    class T:
+        amount: Decimal = DecimalField(places=2, max_digits=5, ge=0, lt=Decimal("100.5"))
+        digits: Decimal = DecimalField(max_digits=3, optional=True)
+
+    t = T(amount=Decimal("12.3"))
+    assert t.amount == Decimal("12.30")
+    assert str(t.amount) == "12.30"
+    assert t.__dict__["amount"] == 1230
+
+    t.amount = Decimal("100.40")
+    assert t.amount == Decimal("100.4")
+
+    t.digits = Decimal("1.23")
+    assert t.digits == Decimal("1.23")
+
+    with pytest.raises(ValueError):
+        t.amount = Decimal("1.234")
+
+    with pytest.raises(ValueError):
+        t.amount = Decimal("100.50")
+
+    with pytest.raises(ValueError):
+        t.amount = Decimal("-0.01")
+
+    with pytest.raises(ValueError):
+        t.amount = Decimal("NaN")
+
+    with pytest.raises(ValueError):
+        t.digits = Decimal("12.34")
+
+    with pytest.raises(ValueError):
+        T(amount=Decimal("1000.00"))
+
+
+def test_decimal_places_large_exponent():
+    """Test decimal places with large exponents.
+
+    GIVEN a dataclass with `Decimal` fields with `places` and limits or `max_digits`
+    WHEN a value with a large exponent is given
+    THEN it should be rejected without scaling it and valid values should be scaled once
+    """
+    class CountingDecimalField(DecimalField):
+        calls = 0
+
+        def _to_int(self, value):
+            CountingDecimalField.calls += 1
+            return super()._to_int(value)
+
+    @dataclass
+    class T:
+        limited: Decimal = CountingDecimalField(places=2, le=1000)
+        digits: Decimal = CountingDecimalField(places=2, max_digits=10, default=Decimal("0"))
+
+    t = T(limited=Decimal("10"))
+    assert CountingDecimalField.calls == 2
+
+    for value in ("1e5000000", "-1e5000000"):
+        with pytest.raises(ValueError):
+            t.digits = Decimal(value)
+
+    with pytest.raises(ValueError):
+        t.limited = Decimal("1e5000000")
+
+    with pytest.raises(ValueError):
+        t.limited = Decimal("1e-5000000")
+
+    t.limited = Decimal("0e5000000")
+    assert t.limited == 0
+    assert CountingDecimalField.calls == 4
+
+
+def test_int_choices():
+    """Test int choices.
+
+    GIVEN a dataclass with an `int` field with choices
+    WHEN a value is given
+    THEN only the choices should be valid.
+    """
+    @dataclass
+    class T:
+        port: int = IntField(choices=range(8000, 8010), le=8005)
+
+    assert T(port=8001).port == 8001
+
+    with pytest.raises(ValueError):
+        T(port=80)
+
+    with pytest.raises(ValueError):
+        T(port=8007)
+
+
+def test_ranges():
+    """Test ranges.
+
+    GIVEN a dataclass with number fields with ranges
+    WHEN a value is given
+    THEN it should be valid only within one of the ranges.
+    """
+    @dataclass
+    class T:
+        port: int = IntField(ranges=[(8000, 8080), (20, 22), (8050, 8100), (443, 443)])
+        tariff: Decimal = DecimalField(ranges=[(None, Decimal("-10")), (Decimal("5.5"), None)], places=1)
+
+    field = vars(T)["port"]
+    assert field.ranges == ((20, 22), (443, 443), (8000, 8100))
+    assert NumberField(ranges=[(None, 5), (None, 10), (20, None), (30, 40)]).ranges == ((None, 10), (20, None))
+
+    for port in (20, 21, 22, 443, 8000, 8090, 8100):
+        assert T(port=port, tariff=Decimal("6")).port == port
+
+    for port in (19, 23, 442, 444, 7999, 8101):
+        with pytest.raises(ValueError):
+            T(port=port, tariff=Decimal("6"))
+
+    assert T(port=22, tariff=Decimal("-20.5")).tariff == Decimal("-20.5")
+
+    with pytest.raises(ValueError):
+        T(port=22, tariff=Decimal("0"))
+
+    with pytest.raises(ValueError):
+        NumberField(ranges=[(10, 1)])
+
+    with pytest.raises(ValueError):
+        NumberField(ranges=[])
+
+    @dataclass
+    class F:
+        ratio: float = NumberField(ranges=[(0, 1)])
+
+    with pytest.raises(ValueError):
+        F(ratio=float("nan"))
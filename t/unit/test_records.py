@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Optional
+import pytest
+from dcv import validate_records
+from dcv.fields import (
+    BoolField, DateTimeField, DecimalField, FloatField, IntField, TextField, TimeDeltaField
+)
+from dcv.records import record_dtype
+
+np = pytest.importorskip("numpy")
+
+
+class EvenIntField(IntField):
+    """Int field accepting only even numbers."""
+
+    def validate(self, value):
+        super().validate(value)
+        if value % 2:
+            raise ValueError(f"'{self.public_attr_name}' must be even.")
+
+
+@dataclass
+class Reading:
+    sensor: int = IntField(ge=0, choices=[1, 2, 3])
+    value: float = FloatField(ranges=[(0, 10), (20, 30)])
+    unit: bytes = TextField(max_length=4, choices=[b"C", b"F"])
+    label: str = TextField(max_length=8, regex="^[a-z]+$")
+    taken: datetime = DateTimeField(ge=datetime(2020, 1, 1))
+    elapsed: timedelta = TimeDeltaField(lt=timedelta(hours=1))
+    ok: bool = BoolField()
+    step: int = EvenIntField()
+
+
+def make_records():
+    records = np.zeros(4, dtype=record_dtype(Reading))
+    records["sensor"] = [1, 2, 5, 3]
+    records["value"] = [1.5, 25.0, 15.0, np.nan]
+    records["unit"] = [b"C", b"F", b"C", b"K"]
+    records["label"] = ["abc", "Abc", "x", "y"]
+    records["taken"] = np.array(
+        ["2021-01-01T00:00", "2019-12-31T23:59", "2020-01-01T00:00", "2022-06-01T12:00"],
+        dtype="M8[us]"
+    )
+    records["elapsed"] = np.array([10, 3600, 59, 0], dtype="m8[s]")
+    records["ok"] = [True, False, True, False]
+    records["step"] = [2, 4, 6, 7]
+    return records
+
+
+def test_record_dtype():
+    """Record dtype.
+
+    GIVEN a dataclass with dcv fields
+    WHEN a NumPy dtype is built for it
+    THEN every field should have a fixed size column
+    """
+    dtype = record_dtype(Reading)
+
+    assert dtype.names == ("sensor", "value", "unit", "label", "taken", "elapsed", "ok", "step")
+    assert dtype["unit"] == np.dtype("S4")
+    assert dtype["label"] == np.dtype("U8")
+    assert dtype["taken"] == np.dtype("M8[us]")
+
+    @dataclass
+    class T:
+        amount: Optional[Decimal] = DecimalField(optional=True)
+
+    with pytest.raises(TypeError):
+        record_dtype(T)
+
+
+def test_validate_records(tmp_path):
+    """Validate records.
+
+    GIVEN a structured array and a file of records
+    WHEN they are validated against a dataclass with dcv fields
+    THEN the indices of the invalid records should be returned for each field
+    """
+    records = make_records()
+    expected = {
+        "sensor": [2],
+        "value": [2, 3],
+        "unit": [3],
+        "label": [1],
+        "taken": [1],
+        "elapsed": [1],
+        "step": [3],
+    }
+
+    invalid = validate_records(Reading, records, chunk_size=3)
+    assert {name: indices.tolist() for name, indices in invalid.items()} == expected
+
+    path = tmp_path / "readings.bin"
+    records.tofile(path)
+    invalid = validate_records(Reading, path, chunk_size=2)
+    assert {name: indices.tolist() for name, indices in invalid.items()} == expected
+
+    assert validate_records(Reading, records[:1]) == {}
+
+
+def test_validate_records_large_int_limits():
+    """Validate records with integer limits above 2**53.
+
+    GIVEN int columns and limits which cannot be represented exactly as floats
+    WHEN the records are validated
+    THEN the limits should be compared exactly, as for a single value
+    """
+    @dataclass
+    class T:
+        low: int = IntField(ge=2**53 + 1)
+        high: int = IntField(lt=2**63 - 1)
+        half: int = IntField(gt=Decimal("2.5"), le=Decimal("9007199254740993.5"))
+        ranged: int = IntField(ranges=[(None, -2**62), (2**53 + 1, 2**53 + 3), (2**64, None)])
+
+    values = [2**53, 2**53 + 1, 2**53 + 3, 2**63 - 1, 3, -2**62 - 1, 2]
+    records = np.zeros(len(values), dtype=record_dtype(T))
+    for name in ("low", "high", "half", "ranged"):
+        records[name] = values
+
+    invalid = validate_records(T, records)
+    assert {name: indices.tolist() for name, indices in invalid.items()} == {
+        name: [
+            index for index, value in enumerate(values)
+            if not _is_valid_value(T, name, value)
+        ]
+        for name in ("low", "high", "half", "ranged")
+    }
+    assert invalid["low"].tolist() == [0, 4, 5, 6]
+    assert invalid["ranged"].tolist() == [0, 3, 4, 6]
+
+
+def _is_valid_value(cls, name, value):
+    try:
+        cls.__dict__[name]._clean(value)
+    except (TypeError, ValueError):
+        return False
+
+    return True
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Union
+import time
 import pytest
 from dcv.fields import TextField
+from dcv.fields.adaptive import ADAPT_INTERVAL
 
 def test_str():
     """Str and text fields.
@@ -124,3 +127,136 @@ def test_str_regex():
     assert t1.name == "Arturo"
     with pytest.raises(ValueError):
         t2 = T(name="Pedro")
+
+def test_str_intern():
+    """intern parameter
+
+    GIVEN a dataclass with `str` fields and text validators with intern
+    WHEN equal values are given
+    THEN they should share one object
+    """
+    @dataclass
+    class T:
+        country: str = TextField(intern=True, trim=True)
+        currency: str = TextField(intern=2)
+
+    first = T(country=" Mexico ", currency="".join(["M", "XN"]))
+    second = T(country="".join(["Mex", "ico"]), currency="".join(["MX", "N"]))
+    assert first.country is second.country
+    assert first.currency is second.currency
+
+    T(country="x", currency="USD")
+    T(country="x", currency="EUR")
+    third = T(country="x", currency="".join(["MX", "N"]))
+    assert third.currency == "MXN"
+    assert third.currency is not first.currency
+    assert len(vars(T)["currency"]._intern_table) == 2
+
+def test_str_choices():
+    """choices parameter
+
+    GIVEN a dataclass with `str` fields and text validators with choices
+    WHEN a value is given
+    THEN only the choices should be valid
+    """
+    @dataclass
+    class T:
+        opt_out: str = TextField(choices=["Yes", "No"])
+        currency: str = TextField(choices=("MXN", "USD"), case_sensitive=False)
+
+    t = T(opt_out="Yes", currency="usd")
+    assert t.currency == "usd"
+
+    with pytest.raises(ValueError):
+        t.opt_out = "yes"
+
+    with pytest.raises(ValueError):
+        t.currency = "EUR"
+
+def test_str_adaptive():
+    """adaptive parameter
+
+    GIVEN a dataclass with an `str` field and a text validator with adaptive set
+    WHEN a constraint fails often
+    THEN it should be checked first
+    """
+    @dataclass
+    class T:
+        name: str = TextField(max_length=10, min_length=1, regex="^[a-z]+$", adaptive=True)
+
+    checks = vars(T)["name"]._checks
+    assert checks.order == ("blank", "max_length", "min_length", "regex")
+
+    for _ in range(ADAPT_INTERVAL):
+        with pytest.raises(ValueError):
+            T(name="Invalid")
+
+    assert T(name="valid").name == "valid"
+    assert checks.order[0] == "regex"
+
+    with pytest.raises(ValueError):
+        T(name="")
+
+    checks.reset()
+    assert checks.order == ("blank", "max_length", "min_length", "regex")
+
+    # A concurrent reorder can start after another one reset the number of runs.
+    with pytest.raises(ValueError):
+        T(name="Invalid")
+    checks._runs = 0
+    checks._reorder()
+    assert checks.order[0] == "regex"
+
+def test_buffers():
+    """bytes-like values
+
+    GIVEN a dataclass with bytes-like fields and text validators
+    WHEN bytes, bytearray or memoryview values are given
+    THEN they should be validated and trimmed without copying
+    """
+    @dataclass
+    class T:
+        payload: Union[bytes, bytearray, memoryview] = TextField(
+            max_length=5, regex=rb"^[a-z]+$", trim=True
+        )
+        view: Union[bytes, memoryview] = TextField(trim=" ", trim_view=True, choices=[b"ok"])
+
+    buffer = bytearray(b"  abc\n")
+    t = T(payload=memoryview(buffer), view=b" ok ")
+
+    assert isinstance(t.payload, memoryview)
+    assert t.payload.obj is buffer
+    assert t.payload == b"abc"
+    assert isinstance(t.view, memoryview)
+    assert t.view == b"ok"
+
+    t.payload = bytearray(b" ab ")
+    assert t.payload == bytearray(b"ab")
+
+    with pytest.raises(ValueError):
+        t.payload = memoryview(b"abcdef")
+
+    with pytest.raises(ValueError):
+        t.payload = memoryview(b"ABC")
+
+    with pytest.raises(ValueError):
+        t.view = b"no"
+
+    with pytest.raises(ValueError):
+        t.payload = memoryview(b"   ")
+
+    payload = bytearray(b"x" * 10 ** 8)
+    start = time.perf_counter()
+    with pytest.raises(ValueError) as error:
+        t.view = memoryview(payload)
+    assert time.perf_counter() - start < 0.1
+    assert len(str(error.value)) < 200
+
+    @dataclass
+    class C:
+        code: Union[str, bytes, bytearray] = TextField(choices=["a", b"a"])
+
+    for value in ("x" * 10 ** 6, bytearray(b"x" * 10 ** 6)):
+        with pytest.raises(ValueError) as error:
+            C(code=value)
+        assert len(str(error.value)) < 200
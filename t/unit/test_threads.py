@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from dataclasses import dataclass
+from typing import Optional
+import pytest
+from dcv.fields import TextField, IntField, BoolField
+from dcv.utils import get_fields
+
+
+def field_state(field):
+    """Every attribute of a field, mutable containers are copied."""
+    state = {}
+    for klass in type(field).__mro__:
+        for slot in getattr(klass, "__slots__", ()):
+            if hasattr(field, slot):
+                value = getattr(field, slot)
+                state[slot] = copy(value) if isinstance(value, (dict, list, set)) else value
+
+    return state
+
+
+def test_concurrent_instances():
+    """Concurrent use.
+
+    GIVEN a dataclass with dcv fields
+    WHEN instances are created and updated from several threads
+    THEN every instance should keep its own values and fields should not change
+    """
+    @dataclass
+    class T:
+        name: str = TextField(trim=True)
+        number: int = IntField(ge=0)
+        flag: bool = BoolField()
+        note: Optional[str] = TextField(optional=True)
+
+    def work(thread_index):
+        for index in range(2000):
+            t = T(name=f" {thread_index}-{index} ", number=index, flag=bool(index % 2))
+            t.number = index + thread_index
+            assert t.name == f"{thread_index}-{index}"
+            assert t.number == index + thread_index
+            assert t.flag is bool(index % 2)
+            assert t.note is None
+
+        with pytest.raises(ValueError):
+            T(name="x", number=-1, flag=True)
+
+        return thread_index
+
+    fields = get_fields(T)
+    before = {name: field_state(field) for name, field in fields.items()}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert sorted(executor.map(work, range(8))) == list(range(8))
+
+    assert {name: field_state(field) for name, field in fields.items()} == before
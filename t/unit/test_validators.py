@@ -0,0 +1,197 @@
+from dataclasses import dataclass, field
+import pytest
+from dcv import cross_field, replace, validate_mapping
+from dcv.fields import ComputedField, IntField, TextField
+
+
+def test_cross_field():
+    """Test cross field validators.
+
+    GIVEN a dataclass with a validator using two fields
+    WHEN the instance is created or one of the fields is set
+    THEN the validator should run and the previous value restored if it fails.
+    """
+    calls = []
+
+    @dataclass
+    class T:
+        min_qty: int = IntField()
+        name: str = TextField()
+        max_qty: int = IntField(fast_read=True)
+        span = ComputedField(lambda obj: obj.max_qty - obj.min_qty, depends_on=["min_qty", "max_qty"])
+
+        @cross_field("min_qty", "max_qty")
+        def check_quantities(self):
+            calls.append(1)
+            if self.min_qty > self.max_qty:
+                raise ValueError("'min_qty' cannot be more than 'max_qty'.")
+
+    t = T(min_qty=1, max_qty=5, name="a")
+    assert len(calls) == 1
+
+    t.name = "b"
+    assert len(calls) == 1
+
+    t.max_qty = 3
+    assert len(calls) == 2
+    assert t.span == 2
+
+    with pytest.raises(ValueError):
+        t.min_qty = 4
+    assert t.min_qty == 1
+    assert t.span == 2
+
+    with pytest.raises(ValueError):
+        t.max_qty = 0
+    assert t.max_qty == 3
+
+    with pytest.raises(ValueError):
+        T(min_qty=5, max_qty=1, name="a")
+
+    t.check_quantities()
+    assert len(calls) == 6
+
+
+def test_cross_field_default_factory():
+    """Test cross field validators.
+
+    GIVEN a validator using fields with a `default_factory`
+    WHEN the instance is created with and without those fields and they are set
+    THEN the validator should run once every field is set, without computing defaults.
+    """
+    factory_calls = []
+
+    def make_end():
+        factory_calls.append(1)
+        return 0
+
+    @dataclass
+    class R:
+        start: int = IntField()
+        end: int = IntField(default_factory=make_end)
+
+        @cross_field("start", "end")
+        def check_order(self):
+            if self.start >= self.end:
+                raise ValueError("'start' must be less than 'end'.")
+
+    assert R(start=5, end=10).end == 10
+
+    r = R(start=5)
+    assert factory_calls == []
+
+    with pytest.raises(ValueError):
+        r.end = 1
+    assert "end" not in r.__dict__
+
+    r.end = 6
+    assert r.end == 6
+    assert factory_calls == []
+
+    with pytest.raises(ValueError):
+        R(start=5, end=1)
+
+
+def test_cross_field_post_init():
+    """Test cross field validators.
+
+    GIVEN a validator and a `__post_init__` setting a field not set by `__init__`
+    WHEN the instance is created and the field is set
+    THEN the validator should run after `__post_init__`, a failed first value should be removed.
+    """
+    calls = []
+
+    @dataclass
+    class T:
+        start: int = IntField()
+        end: int = field(default=IntField(), init=False)
+
+        def __post_init__(self):
+            calls.append(self.start)
+            if self.start < 0:
+                self.end = self.start - 1
+
+        @cross_field("start", "end")
+        def check_order(self):
+            calls.append("check")
+            if self.start >= self.end:
+                raise ValueError("'start' must be less than 'end'.")
+
+    t = T(start=1)
+    assert calls == [1]
+
+    with pytest.raises(ValueError):
+        t.end = 0
+    assert "end" not in t.__dict__
+
+    with pytest.raises(ValueError):
+        T(start=-1)
+    assert calls == [1, "check", -1, "check"]
+
+
+def test_cross_field_invalid():
+    """Test cross field validators.
+
+    GIVEN a validator
+    WHEN it uses an attribute which is not a field or no attribute
+    THEN an error should be raised.
+    """
+    with pytest.raises(RuntimeError):
+        @dataclass
+        class T:
+            start: int = IntField()
+
+            @cross_field("start", "end")
+            def check_order(self):
+                pass
+
+    with pytest.raises(TypeError):
+        cross_field()
+
+
+def test_cross_field_inheritance():
+    """Test cross field validators.
+
+    GIVEN a subclass declaring a validator using fields of its base
+    WHEN instances of the base, the subclass and a sibling class are validated
+    THEN only the subclass and its own subclasses should run the validator.
+    """
+    @dataclass
+    class Base:
+        start: int = IntField()
+        end: int = IntField()
+
+    @dataclass
+    class Child(Base):
+        @cross_field("start", "end")
+        def check_order(self):
+            if self.start >= self.end:
+                raise ValueError("'start' must be less than 'end'.")
+
+    @dataclass
+    class GrandChild(Child):
+        pass
+
+    @dataclass
+    class Sibling(Base):
+        pass
+
+    base = Base(start=5, end=1)
+    base.start = 10
+    assert replace(base, end=0).end == 0
+    assert validate_mapping(Base, {"start": 5, "end": 1}) == {"start": 5, "end": 1}
+    Sibling(start=5, end=1)
+
+    for cls in (Child, GrandChild):
+        with pytest.raises(ValueError):
+            cls(start=5, end=1)
+
+        obj = cls(start=1, end=5)
+        with pytest.raises(ValueError):
+            obj.start = 10
+
+        with pytest.raises(ValueError):
+            replace(obj, end=0)
+
+        with pytest.raises(ValueError):
+            validate_mapping(cls, {"start": 5, "end": 1})